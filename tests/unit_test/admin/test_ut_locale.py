@@ -0,0 +1,33 @@
+from mock import patch
+from nose.tools import assert_equal, assert_raises
+
+from ucsmsdk.ucsexception import UcsOperationError
+from ucsmsdk.ucshandle import UcsHandle
+from ucsmsdk.mometa.aaa.AaaLocale import AaaLocale
+from ucsmsdk.mometa.org.OrgOrg import OrgOrg
+
+from ucsm_apis.admin.locale import locale_org_assign
+
+handle = UcsHandle("10.10.10.10", "username", "password")
+locale_dn = "sys/user-ext/locale-test_locale"
+
+
+@patch.object(UcsHandle, 'commit')
+@patch.object(UcsHandle, 'add_mo')
+@patch.object(UcsHandle, 'query_dns')
+def test_locale_org_assign_after_locale_delete(mock_query_dns, mock_add_mo,
+                                               mock_commit):
+    locale = AaaLocale(parent_mo_or_dn="sys/user-ext", name="test_locale")
+    org = OrgOrg(parent_mo_or_dn="org-root", name="finance")
+    mock_query_dns.side_effect = [
+        {locale_dn: locale, org.dn: org},
+        {locale_dn: None, org.dn: org}]
+
+    mo = locale_org_assign(handle, "test_locale", "org1", org_dn=org.dn)
+    assert_equal(mo.dn, locale_dn + "/org-org1")
+
+    # the locale was deleted in between, the second assign must not reuse
+    # the earlier lookup
+    with assert_raises(UcsOperationError):
+        locale_org_assign(handle, "test_locale", "org2", org_dn=org.dn)
+    assert_equal(mock_add_mo.call_count, 1)
@@ -0,0 +1,207 @@
+from mock import Mock, patch
+from nose.tools import assert_equal, raises
+
+from ucsmsdk.ucsexception import UcsOperationError
+from ucsmsdk.ucshandle import UcsHandle
+from ucsmsdk.mometa.aaa.AaaProviderGroup import AaaProviderGroup
+from ucsmsdk.mometa.aaa.AaaProviderRef import AaaProviderRef
+
+from ucsm_apis.admin.radius import radius_provider_group_provider_add, \
+    radius_provider_group_provider_add_many, \
+    radius_provider_group_provider_bulk_exists, \
+    radius_provider_group_provider_remove_many
+from ucsm_apis.utils.utils import query_dn_cache_clear
+
+handle = UcsHandle("10.10.10.10", "username", "password")
+group_dn = "sys/radius-ext/providergroup-test_prov_grp"
+group_mo = AaaProviderGroup(parent_mo_or_dn="sys/radius-ext",
+                            name="test_prov_grp")
+
+
+def _provider_dn(name):
+    return "sys/radius-ext/provider-%s" % name
+
+
+@patch.object(UcsHandle, 'commit')
+@patch.object(UcsHandle, 'add_mo')
+@patch.object(UcsHandle, 'query_dns')
+def test_radius_provider_group_provider_add_many(mock_query_dns,
+                                                 mock_add_mo, mock_commit):
+    query_dn_cache_clear(handle, "sys/radius-ext")
+    mock_query_dns.return_value = {
+        group_dn: group_mo,
+        _provider_dn("prov1"): Mock(),
+        _provider_dn("prov2"): Mock()}
+    providers = [{"name": "prov1", "order": "1"},
+                 {"name": "prov2", "order": "2"}]
+
+    mos = radius_provider_group_provider_add_many(handle, "test_prov_grp",
+                                                  providers)
+
+    assert_equal([mo.name for mo in mos], ["prov1", "prov2"])
+    assert_equal([mo.order for mo in mos], ["1", "2"])
+    assert_equal(mock_query_dns.call_count, 1)
+    assert_equal(mock_add_mo.call_count, 2)
+    assert_equal(mock_commit.call_count, 1)
+
+
+@patch.object(UcsHandle, 'commit')
+@patch.object(UcsHandle, 'add_mo')
+@patch.object(UcsHandle, 'query_dns')
+def test_radius_provider_group_provider_add_keeps_cached_group(
+        mock_query_dns, mock_add_mo, mock_commit):
+    query_dn_cache_clear(handle, "sys/radius-ext")
+    mock_query_dns.return_value = {group_dn: group_mo,
+                                   _provider_dn("prov1"): Mock(),
+                                   _provider_dn("prov2"): Mock()}
+    children = len(group_mo.child)
+
+    mo = radius_provider_group_provider_add(handle, "test_prov_grp", "prov1")
+    radius_provider_group_provider_add(handle, "test_prov_grp", "prov2")
+
+    assert_equal(mo.dn, group_dn + "/provider-ref-prov1")
+    assert_equal(len(group_mo.child), children)
+
+
+@raises(UcsOperationError)
+@patch.object(UcsHandle, 'commit')
+@patch.object(UcsHandle, 'add_mo')
+@patch.object(UcsHandle, 'query_dn')
+@patch.object(UcsHandle, 'query_dns')
+def test_radius_provider_group_provider_add_many_missing_provider(
+        mock_query_dns, mock_query_dn, mock_add_mo, mock_commit):
+    query_dn_cache_clear(handle, "sys/radius-ext")
+    mock_query_dns.return_value = {group_dn: group_mo,
+                                   _provider_dn("prov1"): None}
+    mock_query_dn.return_value = None
+
+    try:
+        radius_provider_group_provider_add_many(handle, "test_prov_grp",
+                                                [{"name": "prov1"}])
+    finally:
+        assert_equal(mock_add_mo.call_count, 0)
+        assert_equal(mock_commit.call_count, 0)
+
+
+@raises(UcsOperationError)
+@patch.object(UcsHandle, 'commit')
+@patch.object(UcsHandle, 'add_mo')
+@patch.object(UcsHandle, 'query_dns')
+def test_radius_provider_group_provider_add_many_second_missing(
+        mock_query_dns, mock_add_mo, mock_commit):
+    query_dn_cache_clear(handle, "sys/radius-ext")
+    mock_query_dns.return_value = {group_dn: group_mo,
+                                   _provider_dn("prov1"): Mock(),
+                                   _provider_dn("prov2"): None}
+
+    try:
+        radius_provider_group_provider_add_many(handle, "test_prov_grp",
+                                                [{"name": "prov1"},
+                                                 {"name": "prov2"}])
+    finally:
+        assert_equal(mock_add_mo.call_count, 0)
+        assert_equal(mock_commit.call_count, 0)
+
+
+def _provider_ref(name, order):
+    return AaaProviderRef(parent_mo_or_dn=group_mo, name=name, order=order)
+
+
+@patch.object(UcsHandle, 'query_children')
+def test_radius_provider_group_provider_bulk_exists_order(
+        mock_query_children):
+    ref1 = _provider_ref("prov1", "1")
+    ref2 = _provider_ref("prov2", "2")
+    mock_query_children.return_value = [ref1, ref2]
+
+    result = radius_provider_group_provider_bulk_exists(
+        handle, "test_prov_grp", ["prov1", "prov2"],
+        order="lowest-available")
+    assert_equal(result, {"prov1": (True, ref1), "prov2": (True, ref2)})
+
+    result = radius_provider_group_provider_bulk_exists(
+        handle, "test_prov_grp", ["prov1", "prov2"], order="2")
+    assert_equal(result, {"prov1": (False, None), "prov2": (True, ref2)})
+    assert_equal(mock_query_children.call_count, 2)
+
+
+@patch.object(UcsHandle, 'query_children')
+def test_radius_provider_group_provider_bulk_exists_missing_group(
+        mock_query_children):
+    mock_query_children.return_value = []
+
+    result = radius_provider_group_provider_bulk_exists(
+        handle, "missing_grp", ["prov1", "prov2"])
+
+    assert_equal(result, {"prov1": (False, None), "prov2": (False, None)})
+    mock_query_children.assert_called_once_with(
+        in_dn="sys/radius-ext/providergroup-missing_grp",
+        class_id="AaaProviderRef")
+
+
+@patch.object(UcsHandle, 'commit')
+@patch.object(UcsHandle, 'add_mo')
+@patch.object(UcsHandle, 'query_dn')
+@patch.object(UcsHandle, 'query_dns')
+def test_radius_provider_group_provider_add_check_exists_unknown_prop(
+        mock_query_dns, mock_query_dn, mock_add_mo, mock_commit):
+    query_dn_cache_clear(handle, "sys/radius-ext")
+    mock_query_dns.return_value = {group_dn: group_mo,
+                                   _provider_dn("prov1"): Mock()}
+
+    mo = radius_provider_group_provider_add(handle, "test_prov_grp", "prov1",
+                                            order="1", check_exists=True,
+                                            future_prop="x")
+
+    assert_equal(mo.future_prop, "x")
+    assert_equal(mock_query_dn.call_count, 0)
+    assert_equal(mock_commit.call_count, 1)
+
+
+@patch.object(UcsHandle, 'commit')
+@patch.object(UcsHandle, 'add_mo')
+@patch.object(UcsHandle, 'query_dn')
+def test_radius_provider_group_provider_add_check_exists_match(
+        mock_query_dn, mock_add_mo, mock_commit):
+    ref = _provider_ref("prov1", "1")
+    mock_query_dn.return_value = ref
+
+    mo = radius_provider_group_provider_add(handle, "test_prov_grp", "prov1",
+                                            order="1", check_exists=True)
+
+    assert_equal(mo, ref)
+    assert_equal(mock_add_mo.call_count, 0)
+    assert_equal(mock_commit.call_count, 0)
+
+
+@patch.object(UcsHandle, 'commit')
+@patch.object(UcsHandle, 'remove_mo')
+@patch.object(UcsHandle, 'query_children')
+def test_radius_provider_group_provider_remove_many(
+        mock_query_children, mock_remove_mo, mock_commit):
+    refs = [_provider_ref("prov1", "1"), _provider_ref("prov2", "2")]
+    mock_query_children.return_value = refs
+
+    radius_provider_group_provider_remove_many(handle, "test_prov_grp",
+                                               ["prov1", "prov2"])
+
+    mock_query_children.assert_called_once_with(in_dn=group_dn,
+                                                class_id="AaaProviderRef")
+    assert_equal([c[0][0] for c in mock_remove_mo.call_args_list], refs)
+    assert_equal(mock_commit.call_count, 1)
+
+
+@raises(UcsOperationError)
+@patch.object(UcsHandle, 'commit')
+@patch.object(UcsHandle, 'remove_mo')
+@patch.object(UcsHandle, 'query_children')
+def test_radius_provider_group_provider_remove_many_missing_name(
+        mock_query_children, mock_remove_mo, mock_commit):
+    mock_query_children.return_value = [_provider_ref("prov1", "1")]
+
+    try:
+        radius_provider_group_provider_remove_many(handle, "test_prov_grp",
+                                                   ["prov1", "prov2"])
+    finally:
+        assert_equal(mock_remove_mo.call_count, 0)
+        assert_equal(mock_commit.call_count, 0)
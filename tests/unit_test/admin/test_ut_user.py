@@ -0,0 +1,209 @@
+from mock import Mock, patch
+from nose.tools import assert_equal, raises
+
+from ucsmsdk.ucsexception import UcsOperationError
+from ucsmsdk.ucshandle import UcsHandle
+
+from ucsm_apis.admin.user import UserSpec, user_bulk_exists, user_create, \
+    user_create_many, user_delete_many, user_exists, user_get, \
+    user_locale_modify, user_modify
+
+handle = UcsHandle("10.10.10.10", "username", "password")
+
+
+@patch('ucsm_apis.admin.user._user_create')
+@patch.object(UcsHandle, 'commit')
+@patch.object(UcsHandle, 'login')
+def test_user_create_many_partial_batch(mock_login, mock_commit,
+                                        mock_user_create):
+    mock_login.return_value = True
+    mock_user_create.side_effect = lambda handle, **user: user["name"]
+    users = [{"name": "test%d" % i, "pwd": "p@ssw0rd"} for i in range(5)]
+
+    mos = user_create_many(handle, users, batch_size=2)
+
+    assert_equal(mos, [user["name"] for user in users])
+    assert_equal(mock_user_create.call_count, 5)
+    assert_equal(mock_commit.call_count, 3)
+
+
+@patch('ucsm_apis.admin.user._user_create')
+@patch.object(UcsHandle, 'commit')
+@patch.object(UcsHandle, 'login')
+def test_user_create_many_full_batches(mock_login, mock_commit,
+                                       mock_user_create):
+    mock_login.return_value = True
+    users = [{"name": "test%d" % i} for i in range(4)]
+
+    user_create_many(handle, users, batch_size=2)
+
+    assert_equal(mock_commit.call_count, 2)
+
+
+@patch.object(UcsHandle, 'query_dn')
+def test_user_get_missing_not_required(mock_query_dn):
+    mock_query_dn.return_value = None
+
+    assert_equal(user_get(handle, "test", must_exist=False), None)
+
+
+@patch.object(UcsHandle, 'query_dn')
+def test_user_exists_missing(mock_query_dn):
+    mock_query_dn.return_value = None
+
+    assert_equal(user_exists(handle, "test"), (False, None))
+
+
+@patch.object(UcsHandle, 'query_children')
+def test_user_bulk_exists(mock_query_children):
+    mo1 = Mock(account_status="active")
+    mo1.name = "test1"
+    mo2 = Mock(account_status="inactive")
+    mo2.name = "test2"
+    mock_query_children.return_value = [mo1, mo2]
+
+    result = user_bulk_exists(handle, ["test1", "test2", "test3"],
+                              account_status="active")
+
+    assert_equal(result, {"test1": (True, mo1),
+                          "test2": (False, None),
+                          "test3": (False, None)})
+    assert_equal(mock_query_children.call_count, 1)
+
+
+@patch.object(UcsHandle, 'commit')
+@patch.object(UcsHandle, 'set_mo')
+@patch.object(UcsHandle, 'query_dn')
+def test_user_modify_unchanged(mock_query_dn, mock_set_mo, mock_commit):
+    mock_query_dn.return_value = Mock(first_name="first")
+
+    user_modify(handle, "test", first_name="first")
+
+    assert_equal(mock_set_mo.call_count, 0)
+    assert_equal(mock_commit.call_count, 0)
+
+
+@patch.object(UcsHandle, 'commit')
+@patch.object(UcsHandle, 'set_mo')
+@patch.object(UcsHandle, 'query_dn')
+def test_user_modify_changed(mock_query_dn, mock_set_mo, mock_commit):
+    mock_query_dn.return_value = Mock(first_name="first")
+
+    user_modify(handle, "test", first_name="other")
+
+    assert_equal(mock_set_mo.call_count, 1)
+    assert_equal(mock_commit.call_count, 1)
+
+
+@patch.object(UcsHandle, 'commit')
+@patch.object(UcsHandle, 'set_mo')
+@patch.object(UcsHandle, 'query_dn')
+def test_user_locale_modify_unchanged(mock_query_dn, mock_set_mo,
+                                      mock_commit):
+    locale = Mock(descr="locale")
+    mock_query_dn.return_value = locale
+
+    mo = user_locale_modify(handle, "test", "testlocale", descr="locale")
+
+    assert_equal(mo, locale)
+    assert_equal(mock_set_mo.call_count, 0)
+    assert_equal(mock_commit.call_count, 0)
+
+
+@patch('ucsm_apis.admin.user._user_create')
+@patch.object(UcsHandle, 'commit')
+def test_user_create_many_specs(mock_commit, mock_user_create):
+    users = [UserSpec("test1", pwd="p@ssw0rd"),
+             UserSpec("test2", descr="second", pwd_min_hours="24")]
+
+    user_create_many(handle, users)
+
+    assert_equal(mock_user_create.call_count, 2)
+    assert_equal(mock_user_create.call_args_list[0][1]["pwd"], "p@ssw0rd")
+    assert_equal(mock_user_create.call_args_list[1][1]["descr"], "second")
+    assert_equal(mock_user_create.call_args_list[1][1]["pwd_min_hours"],
+                 "24")
+    assert_equal(mock_commit.call_count, 1)
+
+
+@patch('ucsm_apis.admin.user._user_create')
+@patch.object(UcsHandle, 'commit')
+@patch.object(UcsHandle, 'query_dn')
+def test_user_create_check_exists_match(mock_query_dn, mock_commit,
+                                        mock_user_create):
+    mo = Mock()
+    mo.check_prop_match.return_value = True
+    mock_query_dn.return_value = mo
+
+    assert_equal(user_create(handle, "test", check_exists=True), mo)
+    assert_equal(mock_user_create.call_count, 0)
+    assert_equal(mock_commit.call_count, 0)
+
+
+@patch('ucsm_apis.admin.user._user_create')
+@patch.object(UcsHandle, 'commit')
+@patch.object(UcsHandle, 'query_dn')
+def test_user_create_check_exists_missing(mock_query_dn, mock_commit,
+                                          mock_user_create):
+    mock_query_dn.return_value = None
+
+    user_create(handle, "test", check_exists=True)
+
+    assert_equal(mock_user_create.call_count, 1)
+    assert_equal(mock_commit.call_count, 1)
+
+
+def _user_mo(name):
+    mo = Mock(dn="sys/user-ext/user-%s" % name)
+    mo.name = name
+    return mo
+
+
+@patch.object(UcsHandle, 'commit')
+@patch.object(UcsHandle, 'remove_mo')
+@patch.object(UcsHandle, 'query_children')
+def test_user_delete_many(mock_query_children, mock_remove_mo, mock_commit):
+    mock_query_children.return_value = [_user_mo("test1"), _user_mo("test2"),
+                                        _user_mo("test3")]
+
+    user_delete_many(handle, ["test1", "test3"])
+
+    assert_equal(mock_remove_mo.call_count, 2)
+    assert_equal(mock_commit.call_count, 1)
+
+
+@raises(UcsOperationError)
+@patch.object(UcsHandle, 'commit')
+@patch.object(UcsHandle, 'remove_mo')
+@patch.object(UcsHandle, 'query_children')
+def test_user_delete_many_missing(mock_query_children, mock_remove_mo,
+                                  mock_commit):
+    mock_query_children.return_value = [_user_mo("test1")]
+
+    try:
+        user_delete_many(handle, ["test1", "test2"])
+    finally:
+        assert_equal(mock_remove_mo.call_count, 0)
+        assert_equal(mock_commit.call_count, 0)
+
+
+@raises(UcsOperationError)
+def test_user_create_many_invalid_batch_size():
+    user_create_many(handle, [{"name": "test1"}], batch_size=0)
+
+
+@raises(KeyError)
+@patch('ucsm_apis.admin.user._user_create')
+@patch.object(UcsHandle, 'commit_buffer_discard')
+@patch.object(UcsHandle, 'commit')
+def test_user_create_many_discards_failed_batch(mock_commit, mock_discard,
+                                                mock_user_create):
+    mock_user_create.side_effect = lambda handle, **user: user["name"]
+    users = [{"name": "test1"}, {"pwd": "p@ssw0rd"}]
+
+    try:
+        user_create_many(handle, users)
+    finally:
+        assert_equal(mock_user_create.call_count, 2)
+        assert_equal(mock_commit.call_count, 0)
+        assert_equal(mock_discard.call_count, 1)
@@ -979,3 +979,68 @@ def test_boot_special_case_05(mock_login, mock_query_dn, mock_order_clear):
          boot_policy_order_set(handle, boot_policy_dn, devices)
     assert_equal(error.exception.message, expected_error_message)
 
+
+def _single_path_policy():
+    from ucsm_apis.server.boot import _device_add
+
+    bp = LsbootPolicy("org-root", name="test")
+    devices = [
+                {"device_name": "san",
+                 "device_order": "1",
+                 "vnic_name": "vhba0",
+                 "type": "primary",
+                 "target_type": "primary",
+                 "wwn": "20:00:00:25:B5:00:00:01",
+                 "lun": "0",
+                 },
+                {"device_name": "lan",
+                 "device_order": "2",
+                 "vnic_name": "vnic0",
+                 },
+    ]
+    _device_add(handle, bp, devices)
+    return bp
+
+
+def _san_path(bp):
+    san = [ch for ch in bp.child if ch.get_class_id() == "LsbootSan"]
+    return san[0].child[0]
+
+
+def test_boot_compare_single_path_san_lan():
+    from ucsm_apis.server.boot import _compare_boot_policy
+
+    _compare_boot_policy(_single_path_policy(), _single_path_policy())
+
+
+def test_boot_compare_single_path_san_mismatch():
+    from ucsm_apis.server.boot import _compare_boot_policy
+
+    existing = _single_path_policy()
+    expected = _single_path_policy()
+    _san_path(expected).vnic_name = "vhba1"
+
+    with assert_raises(UcsOperationError):
+        _compare_boot_policy(existing, expected)
+
+
+def test_boot_compare_single_path_san_wwn_mismatch():
+    from ucsm_apis.server.boot import _compare_boot_policy
+
+    existing = _single_path_policy()
+    expected = _single_path_policy()
+    _san_path(expected).child[0].wwn = "20:00:00:25:B5:00:00:02"
+
+    with assert_raises(UcsOperationError):
+        _compare_boot_policy(existing, expected)
+
+
+def test_boot_compare_single_path_san_lun_mismatch():
+    from ucsm_apis.server.boot import _compare_boot_policy
+
+    existing = _single_path_policy()
+    expected = _single_path_policy()
+    _san_path(expected).child[0].lun = "1"
+
+    with assert_raises(UcsOperationError):
+        _compare_boot_policy(existing, expected)
@@ -0,0 +1,139 @@
+from mock import patch
+from nose.tools import assert_equal, raises
+
+from ucsmsdk.ucshandle import UcsHandle
+from ucsmsdk.mometa.aaa.AaaUser import AaaUser
+
+from ucsm_apis.utils.utils import commit_batch, prop_matcher, \
+    query_dn_cached, query_dn_cache_clear, resolve_dns
+
+handle = UcsHandle("10.10.10.10", "username", "password")
+group_dn = "sys/radius-ext/providergroup-test"
+
+
+@patch.object(UcsHandle, 'query_dn')
+@patch.object(UcsHandle, 'login')
+def test_query_dn_cached_hit(mock_login, mock_query_dn):
+    mock_login.return_value = True
+    mock_query_dn.return_value = "group"
+    query_dn_cache_clear(handle, group_dn)
+
+    assert_equal(query_dn_cached(handle, group_dn), "group")
+    assert_equal(query_dn_cached(handle, group_dn), "group")
+    assert_equal(mock_query_dn.call_count, 1)
+
+
+@patch.object(UcsHandle, 'query_dn')
+@patch.object(UcsHandle, 'login')
+def test_query_dn_cached_expired(mock_login, mock_query_dn):
+    mock_login.return_value = True
+    mock_query_dn.return_value = "group"
+    query_dn_cache_clear(handle, group_dn)
+
+    query_dn_cached(handle, group_dn, ttl=0)
+    query_dn_cached(handle, group_dn, ttl=0)
+    assert_equal(mock_query_dn.call_count, 2)
+
+
+@patch.object(UcsHandle, 'query_dn')
+@patch.object(UcsHandle, 'login')
+def test_query_dn_cached_miss_not_cached(mock_login, mock_query_dn):
+    mock_login.return_value = True
+    mock_query_dn.side_effect = [None, "group"]
+    query_dn_cache_clear(handle, group_dn)
+
+    assert_equal(query_dn_cached(handle, group_dn), None)
+    assert_equal(query_dn_cached(handle, group_dn), "group")
+
+
+@patch.object(UcsHandle, 'query_dn')
+@patch.object(UcsHandle, 'login')
+def test_query_dn_cache_clear_children(mock_login, mock_query_dn):
+    mock_login.return_value = True
+    mock_query_dn.return_value = "mo"
+    child_dn = group_dn + "/provider-ref-test"
+    query_dn_cache_clear(handle, group_dn)
+
+    query_dn_cached(handle, group_dn)
+    query_dn_cached(handle, child_dn)
+    query_dn_cache_clear(handle, group_dn)
+    query_dn_cached(handle, group_dn)
+    query_dn_cached(handle, child_dn)
+    assert_equal(mock_query_dn.call_count, 4)
+
+
+@patch.object(UcsHandle, 'commit_buffer_discard')
+@patch.object(UcsHandle, 'commit')
+@patch.object(UcsHandle, 'add_mo')
+def test_commit_batch_single_commit(mock_add_mo, mock_commit, mock_discard):
+    with commit_batch(handle) as batch:
+        for mo in ["mo1", "mo2", "mo3"]:
+            batch.add_mo(mo, modify_present=True)
+            batch.commit()
+
+    assert_equal(mock_add_mo.call_count, 3)
+    assert_equal(mock_commit.call_count, 1)
+    assert_equal(mock_discard.call_count, 0)
+
+
+@patch.object(UcsHandle, 'commit_buffer_discard')
+@patch.object(UcsHandle, 'commit')
+def test_commit_batch_discard_on_error(mock_commit, mock_discard):
+    try:
+        with commit_batch(handle):
+            raise ValueError("failed")
+    except ValueError:
+        pass
+
+    assert_equal(mock_commit.call_count, 0)
+    assert_equal(mock_discard.call_count, 1)
+
+
+def test_prop_matcher():
+    mo = AaaUser(parent_mo_or_dn="sys/user-ext", name="test",
+                 first_name="first")
+    match = prop_matcher(AaaUser, first_name="first", last_name=None)
+
+    assert_equal(match(mo), True)
+    assert_equal(prop_matcher(AaaUser, first_name="other")(mo), False)
+
+
+@raises(ValueError)
+def test_prop_matcher_unknown_property():
+    prop_matcher(AaaUser, unknown_prop="value")
+
+
+@patch.object(UcsHandle, 'query_dns')
+@patch.object(UcsHandle, 'query_dn')
+def test_resolve_dns(mock_query_dn, mock_query_dns):
+    provider_dn = "sys/radius-ext/provider-test"
+    missing_dn = "sys/radius-ext/provider-missing"
+    mock_query_dn.return_value = "group"
+    mock_query_dns.return_value = {provider_dn: "provider", missing_dn: None}
+    query_dn_cache_clear(handle, group_dn)
+    query_dn_cache_clear(handle, provider_dn)
+    query_dn_cached(handle, group_dn)
+
+    mos = resolve_dns(handle, [group_dn, provider_dn, missing_dn],
+                      cached=True)
+
+    assert_equal(mos, {group_dn: "group", provider_dn: "provider",
+                       missing_dn: None})
+    mock_query_dns.assert_called_once_with([provider_dn, missing_dn])
+    assert_equal(query_dn_cached(handle, provider_dn), "provider")
+    assert_equal(mock_query_dn.call_count, 1)
+
+
+@patch.object(UcsHandle, 'query_dns')
+@patch.object(UcsHandle, 'query_dn')
+def test_resolve_dns_not_cached(mock_query_dn, mock_query_dns):
+    locale_dn = "sys/user-ext/locale-test"
+    mock_query_dn.return_value = None
+    mock_query_dns.return_value = {locale_dn: "locale", "org-root": None}
+    query_dn_cache_clear(handle, locale_dn)
+
+    mos = resolve_dns(handle, [locale_dn, "org-root"])
+
+    assert_equal(mos, {locale_dn: "locale", "org-root": None})
+    assert_equal(query_dn_cached(handle, locale_dn), None)
+    assert_equal(mock_query_dn.call_count, 1)
@@ -16,17 +16,26 @@ This module performs the operation related to Authentication management.
 """
 from ucsmsdk.ucsexception import UcsOperationError
 from ucsmsdk.mometa.aaa.AaaAuthRealm import AaaAuthRealm
+from ucsmsdk.mometa.aaa.AaaConsoleAuth import AaaConsoleAuth
+from ucsmsdk.mometa.aaa.AaaDefaultAuth import AaaDefaultAuth
+from ucsmsdk.mometa.aaa.AaaDomain import AaaDomain
+from ucsmsdk.mometa.aaa.AaaDomainAuth import AaaDomainAuth
+from ..utils.utils import props_changed
 
 _auth_realm_dn = "sys/auth-realm"
+_no_provider_group_realms = frozenset(["none", "local"])
+_no_two_factor_realms = frozenset(["none", "local", "ldap"])
 
 
-def auth_domain_get(handle, name, caller="auth_domain_get"):
+def auth_domain_get(handle, name, caller="auth_domain_get", must_exist=True):
     """
     Gets the auth domain
 
     Args:
         handle (UcsHandle)
         name (string): name of auth domain
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         AaaDomain Managed Object OR None
@@ -35,9 +44,9 @@ def auth_domain_get(handle, name, caller="auth_domain_get"):
         auth_domain_get(handle, name="ciscoucs")
     """
 
-    dn = _auth_realm_dn + "/domain-" + name
+    dn = "%s/domain-%s" % (_auth_realm_dn, name)
     mo = handle.query_dn(dn)
-    if mo is None:
+    if mo is None and must_exist:
         raise UcsOperationError(caller, "Auth Domain '%s' does not exist" % dn)
     return mo
 
@@ -63,8 +72,6 @@ def auth_domain_create(handle, name, refresh_period="600",
     Example:
         auth_domain_create(handle, name="ciscoucs")
     """
-    from ucsmsdk.mometa.aaa.AaaDomain import AaaDomain
-
     mo = AaaDomain(parent_mo_or_dn=_auth_realm_dn,
                    name=name,
                    refresh_period=refresh_period,
@@ -94,9 +101,9 @@ def auth_domain_exists(handle, name, **kwargs):
     Example:
         auth_domain_exists(handle, name="ciscoucs")
     """
-    try:
-        mo = auth_domain_get(handle, name, caller="auth_domain_exists")
-    except UcsOperationError:
+    mo = auth_domain_get(handle, name, caller="auth_domain_exists",
+                         must_exist=False)
+    if mo is None:
         return (False, None)
     mo_exists = mo.check_prop_match(**kwargs)
     return (mo_exists, mo if mo_exists else None)
@@ -125,6 +132,8 @@ def auth_domain_modify(handle, name, **kwargs):
     """
 
     mo = auth_domain_get(handle, name, caller="auth_domain_modify")
+    if not props_changed(mo, **kwargs):
+        return mo
     mo.set_prop_multiple(**kwargs)
     handle.set_mo(mo)
     handle.commit()
@@ -184,14 +193,12 @@ def auth_domain_realm_configure(handle, domain_name, realm="local",
         auth_domain_realm_configure(handle, domain_name="ciscoucs",
                                     realm="ldap")
     """
-    from ucsmsdk.mometa.aaa.AaaDomainAuth import AaaDomainAuth
-
     obj = auth_domain_get(handle, domain_name,
                           caller="auth_domain_realm_configure")
 
-    if realm in ("none", "local"):
+    if realm in _no_provider_group_realms:
         provider_group = ""
-    if realm in ("none", "local", "ldap"):
+    if realm in _no_two_factor_realms:
         use2_factor = "no"
 
     mo = AaaDomainAuth(parent_mo_or_dn=obj,
@@ -223,16 +230,15 @@ def auth_domain_realm_exists(handle, domain_name, **kwargs):
     Example:
         auth_domain_realm_exists(handle, domain_name="ciscoucs", realm="ldap")
     """
-    domain_dn = _auth_realm_dn + "/domain-" + domain_name
-    dn = domain_dn + "/domain-auth"
+    dn = "%s/domain-%s/domain-auth" % (_auth_realm_dn, domain_name)
     mo = handle.query_dn(dn)
     if mo is None:
         return False, None
 
     realm = kwargs['realm']
-    if realm in ("none", "local"):
+    if realm in _no_provider_group_realms:
         kwargs['provider_group'] = ""
-    if realm in ("none", "local", "ldap"):
+    if realm in _no_two_factor_realms:
         kwargs['use2_factor'] = "no"
 
     mo_exists = mo.check_prop_match(**kwargs)
@@ -268,8 +274,6 @@ def native_auth_configure(handle, def_role_policy=None,
         native_auth_configure(handle, def_role_policy="assign-default-role",
                               con_login="local")
     """
-    from ucsmsdk.mometa.aaa.AaaAuthRealm import AaaAuthRealm
-
     mo = AaaAuthRealm(parent_mo_or_dn="sys")
 
     args = {'def_role_policy': def_role_policy,
@@ -301,8 +305,6 @@ def native_auth_exists(handle, **kwargs):
     Example:
         native_auth_exists(handle, def_role_policy="assign-default-role")
     """
-    from ucsmsdk.mometa.aaa.AaaAuthRealm import AaaAuthRealm
-
     mo = AaaAuthRealm(parent_mo_or_dn="sys")
     mo = handle.query_dn(mo.dn)
     if mo is None:
@@ -341,13 +343,11 @@ def native_auth_default_configure(handle, realm="local", refresh_period="600",
     Example:
         native_auth_default_configure(handle, realm="radius")
     """
-    from ucsmsdk.mometa.aaa.AaaDefaultAuth import AaaDefaultAuth
-
     mo = AaaDefaultAuth(parent_mo_or_dn=_auth_realm_dn)
 
-    if realm in ("none", "local"):
+    if realm in _no_provider_group_realms:
         provider_group = ""
-    if realm in ("none", "local", "ldap"):
+    if realm in _no_two_factor_realms:
         use2_factor = "no"
 
     args = {'realm': realm,
@@ -382,17 +382,15 @@ def native_auth_default_exists(handle, **kwargs):
     Example:
         native_auth_default_exists(handle, realm="radius")
     """
-    from ucsmsdk.mometa.aaa.AaaDefaultAuth import AaaDefaultAuth
-
     mo = AaaDefaultAuth(parent_mo_or_dn=_auth_realm_dn)
     mo = handle.query_dn(mo.dn)
     if mo is None:
         return False, None
 
     realm = kwargs['realm']
-    if realm in ("none", "local"):
+    if realm in _no_provider_group_realms:
         kwargs['provider_group'] = ""
-    if realm in ("none", "local", "ldap"):
+    if realm in _no_two_factor_realms:
         kwargs['use2_factor'] = "no"
 
     mo_exists = mo.check_prop_match(**kwargs)
@@ -425,13 +423,11 @@ def native_auth_console_configure(handle, realm="local", provider_group="",
     Example:
         native_auth_console_configure(handle, realm="local")
     """
-    from ucsmsdk.mometa.aaa.AaaConsoleAuth import AaaConsoleAuth
-
     mo = AaaConsoleAuth(parent_mo_or_dn=_auth_realm_dn)
 
-    if realm in ("none", "local"):
+    if realm in _no_provider_group_realms:
         provider_group = ""
-    if realm in ("none", "local", "ldap"):
+    if realm in _no_two_factor_realms:
         use2_factor = "no"
 
     args = {'realm': realm,
@@ -464,17 +460,15 @@ def native_auth_console_exists(handle, **kwargs):
     Example:
         native_auth_console_exists(handle, realm="local")
     """
-    from ucsmsdk.mometa.aaa.AaaConsoleAuth import AaaConsoleAuth
-
     mo = AaaConsoleAuth(parent_mo_or_dn=_auth_realm_dn)
     mo = handle.query_dn(mo.dn)
     if mo is None:
         return False, None
 
     realm = kwargs['realm']
-    if realm in ("none", "local"):
+    if realm in _no_provider_group_realms:
         kwargs['provider_group'] = ""
-    if realm in ("none", "local", "ldap"):
+    if realm in _no_two_factor_realms:
         kwargs['use2_factor'] = "no"
 
     mo_exists = mo.check_prop_match(**kwargs)
@@ -15,6 +15,10 @@
 This module performs the operation related to callhome.
 """
 from ucsmsdk.ucsexception import UcsOperationError
+from ucsmsdk.mometa.callhome.CallhomeDest import CallhomeDest
+from ucsmsdk.mometa.callhome.CallhomePolicy import CallhomePolicy
+from ucsmsdk.mometa.callhome.CallhomeProfile import CallhomeProfile
+from ..utils.utils import props_changed
 
 _base_dn = "call-home"
 
@@ -344,8 +348,6 @@ def callhome_profile_create(handle, name, format="xml", max_size="1000000",
     Example:
         callhome_profile_create(handle, name="callhomeprofile")
     """
-    from ucsmsdk.mometa.callhome.CallhomeProfile import CallhomeProfile
-
     mo = CallhomeProfile(parent_mo_or_dn=_base_dn,
                          name=name,
                          format=format,
@@ -360,7 +362,8 @@ def callhome_profile_create(handle, name, format="xml", max_size="1000000",
     return mo
 
 
-def callhome_profile_get(handle, name, caller="callhome_profile_get"):
+def callhome_profile_get(handle, name, caller="callhome_profile_get",
+                         must_exist=True):
     """
     Gets callhome profile.
 
@@ -368,6 +371,8 @@ def callhome_profile_get(handle, name, caller="callhome_profile_get"):
         handle (UcsHandle)
         name (string): name of callhome profile
         caller (string): name of caller function
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         CallhomeProfile : ManagedObject
@@ -378,9 +383,9 @@ def callhome_profile_get(handle, name, caller="callhome_profile_get"):
     Example:
         callhome_profile_get(handle, name="callhomeprofile")
     """
-    dn = _base_dn + "/profile-" + name
+    dn = "%s/profile-%s" % (_base_dn, name)
     mo = handle.query_dn(dn)
-    if mo is None:
+    if mo is None and must_exist:
         raise UcsOperationError(caller,
                                 "Callhome Profile '%s' does not exist" % dn)
     return mo
@@ -406,10 +411,10 @@ def callhome_profile_exists(handle, name, **kwargs):
     Example:
         callhome_profile_exists(handle, name="callhomeprofile", format="xml")
     """
-    try:
-        mo = callhome_profile_get(handle, name,
-                                   caller="callhome_profile_exist")
-    except UcsOperationError:
+    mo = callhome_profile_get(handle, name,
+                               caller="callhome_profile_exist",
+                               must_exist=False)
+    if mo is None:
         return (False, None)
 
     if 'alert_groups' in kwargs:
@@ -446,6 +451,8 @@ def callhome_profile_modify(handle, name, **kwargs):
         callhome_profile_modify(handle, name="callhomeprofile", format="xml")
     """
     mo = callhome_profile_get(handle, name, caller="callhome_profile_modify")
+    if not props_changed(mo, **kwargs):
+        return mo
     mo.set_prop_multiple(**kwargs)
     handle.set_mo(mo)
     handle.commit()
@@ -499,8 +506,6 @@ def callhome_profile_email_add(handle, profile_name, email, **kwargs):
         callhome_profile_email_add(handle, profile_name="callhomeprofile",
                                     email="ciscoucs@cisco.com")
     """
-    from ucsmsdk.mometa.callhome.CallhomeDest import CallhomeDest
-
     profile = callhome_profile_get(handle, profile_name,
                                     caller="callhome_profile_email_add")
     mo = CallhomeDest(parent_mo_or_dn=profile, email=email)
@@ -511,7 +516,8 @@ def callhome_profile_email_add(handle, profile_name, email, **kwargs):
 
 
 def callhome_profile_email_get(handle, profile_name, email,
-                                caller="callhome_profile_email_get"):
+                                caller="callhome_profile_email_get",
+                                must_exist=True):
     """
     Gets receipient email from callhome profile.
 
@@ -520,6 +526,8 @@ def callhome_profile_email_get(handle, profile_name, email,
         profile_name (string): name of callhome profile
         email (string): receipient email address
         caller (string): name of caller function
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         CallhomeDest : ManagedObject
@@ -531,10 +539,9 @@ def callhome_profile_email_get(handle, profile_name, email,
         callhome_profile_email_get(handle, profile_name="callhomeprofile",
                                     email="ciscoucs@cisco.com")
     """
-    profile_dn = _base_dn + "/profile-" + profile_name
-    dn = profile_dn + "/email-" + email
+    dn = "%s/profile-%s/email-%s" % (_base_dn, profile_name, email)
     mo = handle.query_dn(dn)
-    if mo is None:
+    if mo is None and must_exist:
         raise UcsOperationError(caller,
                             "Callhome Profile Email '%s' does not exist" % dn)
     return mo
@@ -562,10 +569,10 @@ def callhome_profile_email_exists(handle, profile_name, email, **kwargs):
         callhome_profile_email_exists(handle, profile_name="callhomeprofile",
                                        email="ciscoucs@cisco.com")
     """
-    try:
-        mo = callhome_profile_email_get(handle, profile_name, email,
-                                    caller="callhome_profile_email_exists")
-    except UcsOperationError:
+    mo = callhome_profile_email_get(handle, profile_name, email,
+                                caller="callhome_profile_email_exists",
+                                must_exist=False)
+    if mo is None:
         return (False, None)
     mo_exists = mo.check_prop_match(**kwargs)
     return (mo_exists, mo if mo_exists else None)
@@ -642,8 +649,6 @@ def callhome_policy_create(handle, cause, admin_state="enabled",
         callhome_policy_create(handle, cause="equipment-removed",
                                 "name="callhomepolicy")
     """
-    from ucsmsdk.mometa.callhome.CallhomePolicy import CallhomePolicy
-
     mo = CallhomePolicy(parent_mo_or_dn=_base_dn,
                         cause=cause,
                         admin_state=admin_state,
@@ -656,7 +661,8 @@ def callhome_policy_create(handle, cause, admin_state="enabled",
     return mo
 
 
-def callhome_policy_get(handle, cause, caller="callhome_policy_get"):
+def callhome_policy_get(handle, cause, caller="callhome_policy_get",
+                        must_exist=True):
     """
     Gets callhome policy.
 
@@ -664,6 +670,8 @@ def callhome_policy_get(handle, cause, caller="callhome_policy_get"):
         handle (UcsHandle)
         cause (string): cause to trigger call home alert
         caller (string): name of caller function
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         CallhomePolicy : ManagedObject
@@ -674,9 +682,9 @@ def callhome_policy_get(handle, cause, caller="callhome_policy_get"):
     Example:
         callhome_policy_get(handle, cause="equipment-removed")
     """
-    dn = _base_dn + "/policy-" + cause
+    dn = "%s/policy-%s" % (_base_dn, cause)
     mo = handle.query_dn(dn)
-    if mo is None:
+    if mo is None and must_exist:
         raise UcsOperationError(caller,
                             "Callhome Policy '%s' does not exist" % dn)
     return mo
@@ -702,10 +710,10 @@ def callhome_policy_exists(handle, cause, **kwargs):
     Example:
         callhome_policy_exists(handle, cause="equipment-removed")
     """
-    try:
-        mo = callhome_policy_get(handle, cause,
-                                  caller="callhome_policy_exists")
-    except UcsOperationError:
+    mo = callhome_policy_get(handle, cause,
+                              caller="callhome_policy_exists",
+                              must_exist=False)
+    if mo is None:
         return (False, None)
     mo_exists = mo.check_prop_match(**kwargs)
     return (mo_exists, mo if mo_exists else None)
@@ -732,6 +740,8 @@ def callhome_policy_modify(handle, cause, **kwargs):
         callhome_policy_modify(handle, cause="equipment-removed")
     """
     mo = callhome_policy_get(handle, cause, caller="callhome_policy_modify")
+    if not props_changed(mo, **kwargs):
+        return mo
     mo.set_prop_multiple(**kwargs)
     handle.set_mo(mo)
     handle.commit()
@@ -15,16 +15,20 @@
 This module performs the operation related to dns server management.
 """
 from ucsmsdk.ucsexception import UcsOperationError
+from ucsmsdk.mometa.comm.CommDnsProvider import CommDnsProvider
+from ..utils.utils import props_changed
 
 _dns_svc_dn = "sys/svc-ext/dns-svc"
 
-def dns_server_get(handle, name, caller="dns_server_get"):
+def dns_server_get(handle, name, caller="dns_server_get", must_exist=True):
     """
     Gets the dns entry
 
     Args:
         handle (UcsHandle)
         name (string): IP address of the dns server
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         CommDnsProvider: Managed object OR None
@@ -33,9 +37,9 @@ def dns_server_get(handle, name, caller="dns_server_get"):
         bool_var = dns_server_get(handle, "10.10.10.10")
     """
 
-    dn = _dns_svc_dn  + "/dns-" + name
+    dn = "%s/dns-%s" % (_dns_svc_dn, name)
     mo = handle.query_dn(dn)
-    if mo is None:
+    if mo is None and must_exist:
         raise UcsOperationError(caller, "Dns Server '%s' does not exist" % dn)
     return mo
 
@@ -58,8 +62,6 @@ def dns_server_add(handle, name, descr=None, **kwargs):
         mo = dns_server_add(handle, name="8.8.8.8", descr="dns_google")
     """
 
-    from ucsmsdk.mometa.comm.CommDnsProvider import CommDnsProvider
-
     mo = CommDnsProvider(
         parent_mo_or_dn=_dns_svc_dn,
         name=name,
@@ -88,9 +90,8 @@ def dns_server_exists(handle, name, **kwargs):
     Example:
         bool_var = dns_server_exists(handle, "10.10.10.10")
     """
-    try:
-        mo = dns_server_get(handle, name)
-    except UcsOperationError:
+    mo = dns_server_get(handle, name, must_exist=False)
+    if mo is None:
         return (False, None)
     mo_exists = mo.check_prop_match(**kwargs)
     return (mo_exists, mo if mo_exists else None)
@@ -117,6 +118,8 @@ def dns_server_modify(handle, name, **kwargs):
     """
 
     mo = dns_server_get(handle, name, caller="dns_server_modify")
+    if not props_changed(mo, **kwargs):
+        return mo
     mo.set_prop_multiple(**kwargs)
     handle.set_mo(mo)
     handle.commit()
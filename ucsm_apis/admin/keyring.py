@@ -15,6 +15,10 @@
 This module performs the operation related to key management.
 """
 from ucsmsdk.ucsexception import UcsOperationError
+from ucsmsdk.mometa.pki.PkiCertReq import PkiCertReq
+from ucsmsdk.mometa.pki.PkiKeyRing import PkiKeyRing
+from ucsmsdk.mometa.pki.PkiTP import PkiTP
+from ..utils.utils import props_changed
 
 _keyring_base_dn = "sys/pki-ext"
 _tp_base_dn = "sys/pki-ext"
@@ -50,8 +54,6 @@ def key_ring_create(handle, name, modulus="mod2048", regen="no",
     Example:
         key_ring = key_ring_create(handle, name="mykeyring", regen="yes")
     """
-    from ucsmsdk.mometa.pki.PkiKeyRing import PkiKeyRing
-
     mo = PkiKeyRing(parent_mo_or_dn=_keyring_base_dn,
                     name=name,
                     modulus=modulus,
@@ -67,7 +69,7 @@ def key_ring_create(handle, name, modulus="mod2048", regen="no",
     return mo
 
 
-def key_ring_get(handle, name, caller="key_ring_get"):
+def key_ring_get(handle, name, caller="key_ring_get", must_exist=True):
     """
     Gets the key ring
 
@@ -75,6 +77,8 @@ def key_ring_get(handle, name, caller="key_ring_get"):
         handle (UcsHandle)
         name (string): name of key ring
         caller (string): name of the caller function
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         PkiKeyRing: Managed Object
@@ -85,9 +89,9 @@ def key_ring_get(handle, name, caller="key_ring_get"):
     Example:
         key_ring = key_ring_get(handle, name="mykeyring")
     """
-    dn = _keyring_base_dn + "/keyring-" + name
+    dn = "%s/keyring-%s" % (_keyring_base_dn, name)
     mo = handle.query_dn(dn)
-    if mo is None:
+    if mo is None and must_exist:
         raise UcsOperationError(caller,
                                 "Key Ring '%s' does not exist" % dn)
     return mo
@@ -113,9 +117,8 @@ def key_ring_exists(handle, name, **kwargs):
     Example:
         key_ring = key_ring_exists(handle, name="mykeyring")
     """
-    try:
-        mo = key_ring_get(handle, name, caller="key_ring_exists")
-    except UcsOperationError:
+    mo = key_ring_get(handle, name, caller="key_ring_exists", must_exist=False)
+    if mo is None:
         return (False, None)
     mo_exists = mo.check_prop_match(**kwargs)
     return (mo_exists, mo if mo_exists else None)
@@ -142,6 +145,8 @@ def key_ring_modify(handle, name, **kwargs):
         key_ring = key_ring_modify(handle, name="mykeyring", regen="no")
     """
     mo = key_ring_get(handle, name, caller="key_ring_modify")
+    if not props_changed(mo, **kwargs):
+        return mo
     mo.set_prop_multiple(**kwargs)
     handle.set_mo(mo)
     handle.commit()
@@ -210,8 +215,6 @@ def certificate_request_create(handle, name,
         certificate_request_create(handle, name="mykeyring", dns="10.10.10.100",
                                 country="IN")
     """
-    from ucsmsdk.mometa.pki.PkiCertReq import PkiCertReq
-
     obj = key_ring_get(handle, name, caller="certificate_request_create")
     mo = PkiCertReq(parent_mo_or_dn=obj, dns=dns,
                     ip=ip, ip_a=ip_a, ip_b=ip_b,
@@ -227,7 +230,8 @@ def certificate_request_create(handle, name,
     return mo
 
 
-def certificate_request_get(handle, name, caller="certificate_request_get"):
+def certificate_request_get(handle, name, caller="certificate_request_get",
+                            must_exist=True):
     """
     Gets a certificate request
 
@@ -235,6 +239,8 @@ def certificate_request_get(handle, name, caller="certificate_request_get"):
         handle (UcsHandle)
         name (string): KeyRing name
         caller (string): name of the caller function
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         PkiCertReq: Managed Object
@@ -245,9 +251,9 @@ def certificate_request_get(handle, name, caller="certificate_request_get"):
     Example:
         certificate_request_get(handle, name="mykeyring")
     """
-    dn = _keyring_base_dn + "/keyring-" + name + "/certreq"
+    dn = "%s/keyring-%s/certreq" % (_keyring_base_dn, name)
     mo = handle.query_dn(dn)
-    if mo is None:
+    if mo is None and must_exist:
         raise UcsOperationError(caller,
                                 "Certificate Request '%s' does not exist" % dn)
     return mo
@@ -273,10 +279,10 @@ def certificate_request_exists(handle, name, **kwargs):
     Example:
         certificate_request_exists(handle, name="mykeyring")
     """
-    try:
-        mo = certificate_request_get(handle, name,
-                                     caller="certificate_request_exists")
-    except UcsOperationError:
+    mo = certificate_request_get(handle, name,
+                                 caller="certificate_request_exists",
+                                 must_exist=False)
+    if mo is None:
         return (False, None)
     mo_exists = mo.check_prop_match(**kwargs)
     return (mo_exists, mo if mo_exists else None)
@@ -335,8 +341,6 @@ def trusted_point_create(handle, name, policy_owner="local",
     Example:
         trusted_point = trusted_point_create(handle, name="mytrustedpoint")
     """
-    from ucsmsdk.mometa.pki.PkiTP import PkiTP
-
     mo = PkiTP(parent_mo_or_dn=_tp_base_dn,
                name=name,
                policy_owner=policy_owner,
@@ -349,7 +353,8 @@ def trusted_point_create(handle, name, policy_owner="local",
     return mo
 
 
-def trusted_point_get(handle, name, caller="trusted_point_get"):
+def trusted_point_get(handle, name, caller="trusted_point_get",
+                      must_exist=True):
     """
     Gets trusted point
 
@@ -357,6 +362,8 @@ def trusted_point_get(handle, name, caller="trusted_point_get"):
         handle (ucshandle)
         name (string): trusted point name
         caller (string): name of the caller function
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         PkiTP: managed object
@@ -368,9 +375,9 @@ def trusted_point_get(handle, name, caller="trusted_point_get"):
         key_ring = trusted_point_get(handle, name="mytrustedpoint")
     """
 
-    dn = _tp_base_dn + "/tp-" + name
+    dn = "%s/tp-%s" % (_tp_base_dn, name)
     mo = handle.query_dn(dn)
-    if mo is None:
+    if mo is None and must_exist:
         raise UcsOperationError(caller,
                                 "Trusted Point '%s' does not exist" % dn)
     return mo
@@ -392,9 +399,9 @@ def trusted_point_exists(handle, name, **kwargs):
     Example:
         trusted_point_exists(handle, name="mytrustedpoint")
     """
-    try:
-        mo = trusted_point_get(handle, name, caller="trusted_point_exists")
-    except UcsOperationError:
+    mo = trusted_point_get(handle, name, caller="trusted_point_exists",
+                           must_exist=False)
+    if mo is None:
         return (False, None)
     mo_exists = mo.check_prop_match(**kwargs)
     return (mo_exists, mo if mo_exists else None)
@@ -422,6 +429,8 @@ def trusted_point_modify(handle, name, **kwargs):
                                              descr="testing tp")
     """
     mo = trusted_point_get(handle, name, caller="trusted_point_modify")
+    if not props_changed(mo, **kwargs):
+        return mo
     mo.set_prop_multiple(**kwargs)
     handle.set_mo(mo)
     handle.commit()
@@ -15,9 +15,29 @@
 This module performs the operation related to ldap.
 """
 from ucsmsdk.ucsexception import UcsOperationError
-from ..admin.locale import locale_get, locale_exists
+from ucsmsdk.mometa.aaa.AaaLdapGroup import AaaLdapGroup
+from ucsmsdk.mometa.aaa.AaaLdapGroupRule import AaaLdapGroupRule
+from ucsmsdk.mometa.aaa.AaaLdapProvider import AaaLdapProvider
+from ucsmsdk.mometa.aaa.AaaProviderGroup import AaaProviderGroup
+from ucsmsdk.mometa.aaa.AaaProviderRef import AaaProviderRef
+from ucsmsdk.mometa.aaa.AaaUserLocale import AaaUserLocale
+from ucsmsdk.mometa.aaa.AaaUserRole import AaaUserRole
+from ..utils.utils import prop_matcher, props_changed, props_known, \
+    query_dn_cached, query_dn_cache_clear, resolve_dns
+from ..admin.locale import locale_get
+from ..admin.role import role_get
 
 _ldap_dn = "sys/ldap-ext"
+_provider_dn_get = (_ldap_dn + "/provider-{0}").format
+_provider_group_dn_get = (_ldap_dn + "/providergroup-{0}").format
+_provider_ref_dn_get = (_ldap_dn +
+                        "/providergroup-{0}/provider-ref-{1}").format
+_ldap_group_dn_get = (_ldap_dn + "/ldapgroup-{0}").format
+_ldap_group_role_dn_get = (_ldap_dn + "/ldapgroup-{0}/role-{1}").format
+_ldap_group_locale_dn_get = (_ldap_dn +
+                              "/ldapgroup-{0}/locale-{1}").format
+_ldap_group_rule_dn_get = (_ldap_dn +
+                            "/provider-{0}/ldapgroup-rule").format
 
 def ldap_configure(handle, timeout="30", attribute="CiscoAvPair",
                    filter="cn=$userid", retries="1", policy_owner = "local",
@@ -91,7 +111,7 @@ def ldap_provider_create(handle, name, order="lowest-available", rootdn=None,
                          basedn="", port="389", enable_ssl="no", filter=None,
                          attribute=None, key=None, timeout="30",
                          vendor="OpenLdap", retries="1",
-                         descr=None, **kwargs):
+                         descr=None, check_exists=False, **kwargs):
     """
     creates a ldap provider
 
@@ -111,6 +131,9 @@ def ldap_provider_create(handle, name, order="lowest-available", rootdn=None,
          valid values are "MS-AD", "OpenLdap"
         retries (string): retries
         descr (string): description
+        check_exists (bool): if True, looks the object up first and returns
+         it without committing when it already matches the given properties,
+         skipped when kwargs hold properties unknown to ucsmsdk
         **kwargs: Any additional key-value pair of managed object(MO)'s
                   property and value, which are not part of regular args.
                   This should be used for future version compatibility.
@@ -124,7 +147,14 @@ def ldap_provider_create(handle, name, order="lowest-available", rootdn=None,
         ldap_provider_create(handle, name="test_ldap_prov", port="320",
                              order="3")
     """
-    from ucsmsdk.mometa.aaa.AaaLdapProvider import AaaLdapProvider
+    if check_exists and props_known(AaaLdapProvider, kwargs):
+        mo_exists, mo = ldap_provider_exists(
+            handle, name, order=order, rootdn=rootdn, basedn=basedn,
+            port=port, enable_ssl=enable_ssl, filter=filter,
+            attribute=attribute, key=key, timeout=timeout, vendor=vendor,
+            retries=retries, descr=descr, **kwargs)
+        if mo_exists:
+            return mo
 
     mo = AaaLdapProvider(parent_mo_or_dn=_ldap_dn,
                          name=name,
@@ -147,7 +177,8 @@ def ldap_provider_create(handle, name, order="lowest-available", rootdn=None,
     return mo
 
 
-def ldap_provider_get(handle, name, caller="ldap_provider_get"):
+def ldap_provider_get(handle, name, caller="ldap_provider_get", cached=False,
+                      must_exist=True):
     """
     Gets the ldap provider
 
@@ -155,6 +186,10 @@ def ldap_provider_get(handle, name, caller="ldap_provider_get"):
         handle (UcsHandle)
         name (string): name of ldap provider
         caller (string): name of the caller function
+        cached (bool): reuse a recent lookup of the same object on this
+         handle, meant for parent lookups
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         AaaLdapProvider : managed object
@@ -165,9 +200,12 @@ def ldap_provider_get(handle, name, caller="ldap_provider_get"):
     Example:
         ldap_provider_get(handle, name="test_ldap_provider")
     """
-    dn = _ldap_dn + "/provider-" + name
-    mo = handle.query_dn(dn)
-    if mo is None:
+    dn = _provider_dn_get(name)
+    if cached:
+        mo = query_dn_cached(handle, dn)
+    else:
+        mo = handle.query_dn(dn)
+    if mo is None and must_exist:
         raise UcsOperationError(caller,
                                 "Ldap Provider '%s' does not exist" % dn)
     return mo
@@ -193,9 +231,9 @@ def ldap_provider_exists(handle, name, **kwargs):
     Example:
         ldap_provider_exists(handle, name="test_ldap_provider")
     """
-    try:
-        mo = ldap_provider_get(handle, name, caller="ldap_provider_exists")
-    except UcsOperationError:
+    mo = ldap_provider_get(handle, name, caller="ldap_provider_exists",
+                           must_exist=False)
+    if mo is None:
         return (False, None)
 
     if 'order' in kwargs and kwargs['order'] == 'lowest-available':
@@ -226,6 +264,8 @@ def ldap_provider_modify(handle, name, **kwargs):
         ldap_provider_modify(handle, name="test_ldap_prov", enable_ssl="yes")
     """
     mo = ldap_provider_get(handle, name, "ldap_provider_modify")
+    if not props_changed(mo, **kwargs):
+        return mo
     mo.set_prop_multiple(**kwargs)
     handle.set_mo(mo)
     handle.commit()
@@ -252,6 +292,7 @@ def ldap_provider_delete(handle, name):
     mo = ldap_provider_get(handle, name, "ldap_provider_delete")
     handle.remove_mo(mo)
     handle.commit()
+    query_dn_cache_clear(handle, mo.dn)
 
 
 def ldap_provider_group_rules_configure(handle, ldap_provider_name,
@@ -290,8 +331,6 @@ def ldap_provider_group_rules_configure(handle, ldap_provider_name,
                                         ldap_provider_name="test_ldap_prov",
                                         authorization="enable")
     """
-    from ucsmsdk.mometa.aaa.AaaLdapGroupRule import AaaLdapGroupRule
-
     obj = ldap_provider_get(handle, ldap_provider_name,
                             "ldap_provider_group_rules_configure")
 
@@ -331,8 +370,7 @@ def ldap_provider_group_rules_exists(handle, ldap_provider_name, **kwargs):
                                     ldap_provider_name="test_ldap_provider",
                                     authorization="enable")
     """
-    provider_dn = _ldap_dn + "/provider-" + ldap_provider_name
-    dn = provider_dn + "/ldapgroup-rule"
+    dn = _ldap_group_rule_dn_get(ldap_provider_name)
     mo = handle.query_dn(dn)
     if mo is None:
         return False, None
@@ -358,8 +396,6 @@ def ldap_group_create(handle, name, descr=None, **kwargs):
     Example:
         ldap_group_create(handle, name="test_ldap_grp_map")
     """
-    from ucsmsdk.mometa.aaa.AaaLdapGroup import AaaLdapGroup
-
     mo = AaaLdapGroup(parent_mo_or_dn=_ldap_dn, name=name, descr=descr)
     mo.set_prop_multiple(**kwargs)
     handle.add_mo(mo, modify_present=True)
@@ -367,7 +403,7 @@ def ldap_group_create(handle, name, descr=None, **kwargs):
     return mo
 
 
-def ldap_group_get(handle, name, caller="ldap_group_get"):
+def ldap_group_get(handle, name, caller="ldap_group_get", must_exist=True):
     """
     Gets ldap group map
 
@@ -375,6 +411,8 @@ def ldap_group_get(handle, name, caller="ldap_group_get"):
         handle (UcsHandle)
         name (string): ldap group name
         caller (string): name of the caller function
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         AaaLdapGroup : managed object
@@ -385,9 +423,9 @@ def ldap_group_get(handle, name, caller="ldap_group_get"):
     Example:
         ldap_group_get(handle, name="test_ldap_group")
     """
-    dn = _ldap_dn + "/ldapgroup-" + name
+    dn = _ldap_group_dn_get(name)
     mo = handle.query_dn(dn)
-    if mo is None:
+    if mo is None and must_exist:
         raise UcsOperationError(caller,
                                 "Ldap Group Map '%s' does not exist." % dn)
     return mo
@@ -410,9 +448,8 @@ def ldap_group_exists(handle, name, **kwargs):
     Example:
         ldap_group_exists(handle, name="test_ldap_group")
     """
-    try:
-        mo = ldap_group_get(handle, name, "ldap_group_exists")
-    except UcsOperationError:
+    mo = ldap_group_get(handle, name, "ldap_group_exists", must_exist=False)
+    if mo is None:
         return (False, None)
     mo_exists = mo.check_prop_match(**kwargs)
     return (mo_exists, mo if mo_exists else None)
@@ -463,10 +500,7 @@ def ldap_group_role_add(handle, ldap_group_name, name, descr=None,
         ldap_group_role_add(
           handle, ldap_group_name="test_ldap_grp_map", name="storage")
     """
-    from ucsmsdk.mometa.aaa.AaaUserRole import AaaUserRole
-    from ..admin.role import role_get
-
-    role = role_get(handle, name=name)
+    role_get(handle, name=name, caller="ldap_group_role_add")
 
     ldap_group = ldap_group_get(handle, name=ldap_group_name,
                                 caller="ldap_group_role_add")
@@ -479,7 +513,7 @@ def ldap_group_role_add(handle, ldap_group_name, name, descr=None,
 
 
 def ldap_group_role_get(handle, ldap_group_name, name,
-                            caller="ldap_group_role_get"):
+                            caller="ldap_group_role_get", must_exist=True):
     """
     Gets the role  for the respective ldap group map
 
@@ -488,6 +522,8 @@ def ldap_group_role_get(handle, ldap_group_name, name,
         ldap_group_name (string): name of ldap group
         name (string):  role name
         caller (string): name of the caller function
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         AaaUserRole : managed object
@@ -500,9 +536,9 @@ def ldap_group_role_get(handle, ldap_group_name, name,
                             ldap_group_name="test_ldap_grp_map",
                             name="test_role")
     """
-    dn = _ldap_dn + "/ldapgroup-" + ldap_group_name + "/role-" + name
+    dn = _ldap_group_role_dn_get(ldap_group_name, name)
     mo = handle.query_dn(dn)
-    if mo is None:
+    if mo is None and must_exist:
         raise UcsOperationError(caller,
                                 "Ldap group map role '%s' does not exist" % dn)
     return mo
@@ -531,10 +567,10 @@ def ldap_group_role_exists(handle, ldap_group_name, name, **kwargs):
                                    ldap_group_name="test_ldap_grp_map",
                                    name="test_role")
     """
-    try:
-        mo = ldap_group_role_get(handle, ldap_group_name, name,
-                                     caller="ldap_group_role_exists")
-    except UcsOperationError:
+    mo = ldap_group_role_get(handle, ldap_group_name, name,
+                                 caller="ldap_group_role_exists",
+                                 must_exist=False)
+    if mo is None:
         return (False, None)
     mo_exists = mo.check_prop_match(**kwargs)
     return (mo_exists, mo if mo_exists else None)
@@ -589,10 +625,7 @@ def ldap_group_locale_add(handle, ldap_group_name, name, descr=None,
         ldap_group_locale_add(
           handle, ldap_group_name="test_ldap_grp_map", name="locale1")
     """
-    from ucsmsdk.mometa.aaa.AaaUserLocale import AaaUserLocale
-    from ..admin.locale import locale_get
-
-    locale = locale_get(handle, name, caller="ldap_group_locale_add")
+    locale_get(handle, name, caller="ldap_group_locale_add")
 
     ldap_group = ldap_group_get(handle, name=ldap_group_name,
                          caller="ldap_group_locale_add")
@@ -605,7 +638,7 @@ def ldap_group_locale_add(handle, ldap_group_name, name, descr=None,
 
 
 def ldap_group_locale_get(handle, ldap_group_name, name,
-                          caller="ldap_group_locale_get"):
+                          caller="ldap_group_locale_get", must_exist=True):
     """
     Gets the locale for the respective ldap group map
 
@@ -614,6 +647,8 @@ def ldap_group_locale_get(handle, ldap_group_name, name,
         ldap_group_name (string): name of ldap group
         name (string):  locale name
         caller (string): name of the caller function
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         AaaUserLocale : managed object
@@ -626,9 +661,9 @@ def ldap_group_locale_get(handle, ldap_group_name, name,
                               ldap_group_name="test_ldap_grp_map",
                               name="locale1")
     """
-    dn = _ldap_dn + "/ldapgroup-" + ldap_group_name + "/locale-" + name
+    dn = _ldap_group_locale_dn_get(ldap_group_name, name)
     mo = handle.query_dn(dn)
-    if mo is None:
+    if mo is None and must_exist:
         raise UcsOperationError(caller,
                             "Ldap Group Map Locale '%s' does not exist" % dn)
     return mo
@@ -657,10 +692,10 @@ def ldap_group_locale_exists(handle, ldap_group_name, name, **kwargs):
                                  ldap_group_name="test_ldap_grp_map",
                                  name="locale1")
     """
-    try:
-        mo = ldap_group_locale_get(handle, ldap_group_name, name,
-                                   caller="ldap_group_locale_exists")
-    except UcsOperationError:
+    mo = ldap_group_locale_get(handle, ldap_group_name, name,
+                               caller="ldap_group_locale_exists",
+                               must_exist=False)
+    if mo is None:
         return (False, None)
     mo_exists = mo.check_prop_match(**kwargs)
     return (mo_exists, mo if mo_exists else None)
@@ -713,8 +748,6 @@ def ldap_provider_group_create(handle, name, descr=None, **kwargs):
     Example:
         ldap_provider_group_create(handle, name="test_ldap_group")
     """
-    from ucsmsdk.mometa.aaa.AaaProviderGroup import AaaProviderGroup
-
     mo = AaaProviderGroup(parent_mo_or_dn=_ldap_dn,
                           name=name,
                           descr=descr)
@@ -725,7 +758,8 @@ def ldap_provider_group_create(handle, name, descr=None, **kwargs):
     return mo
 
 
-def ldap_provider_group_get(handle, name, caller="ldap_provider_group_get"):
+def ldap_provider_group_get(handle, name, caller="ldap_provider_group_get",
+                            cached=False, must_exist=True):
     """
     Gets ldap provider group
 
@@ -733,6 +767,10 @@ def ldap_provider_group_get(handle, name, caller="ldap_provider_group_get"):
         handle (UcsHandle)
         name (string): ldap provider group name
         caller (string): name of the caller function
+        cached (bool): reuse a recent lookup of the same object on this
+         handle, meant for parent lookups
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         AaaProviderGroup : managed object
@@ -743,9 +781,12 @@ def ldap_provider_group_get(handle, name, caller="ldap_provider_group_get"):
     Example:
         ldap_provider_group_get(handle, name="test_ldap_group")
     """
-    dn = _ldap_dn + "/providergroup-" + name
-    mo = handle.query_dn(dn)
-    if mo is None:
+    dn = _provider_group_dn_get(name)
+    if cached:
+        mo = query_dn_cached(handle, dn)
+    else:
+        mo = handle.query_dn(dn)
+    if mo is None and must_exist:
         raise UcsOperationError(caller,
                                 "Ldap Provider Group '%s' does not exist" % dn)
     return mo
@@ -771,10 +812,10 @@ def ldap_provider_group_exists(handle, name, **kwargs):
     Example:
         ldap_provider_group_exists(handle, name="test_ldap_group")
     """
-    try:
-        mo = ldap_provider_group_get(handle, name,
-                                     caller="ldap_provider_group_exists")
-    except UcsOperationError:
+    mo = ldap_provider_group_get(handle, name,
+                                 caller="ldap_provider_group_exists",
+                                 must_exist=False)
+    if mo is None:
         return (False, None)
     mo_exists = mo.check_prop_match(**kwargs)
     return (mo_exists, mo if mo_exists else None)
@@ -801,11 +842,12 @@ def ldap_provider_group_delete(handle, name):
                                  caller="ldap_provider_group_delete")
     handle.remove_mo(mo)
     handle.commit()
+    query_dn_cache_clear(handle, mo.dn)
 
 
 def ldap_provider_group_provider_add(handle, group_name, name,
                                      order="lowest-available",
-                                     descr=None, **kwargs):
+                                     descr=None, check_exists=False, **kwargs):
     """
     adds provider to ldap provider group
 
@@ -816,6 +858,9 @@ def ldap_provider_group_provider_add(handle, group_name, name,
         order (string): order
          valid values are "lowest-available" or "0-16"
         descr (string): description
+        check_exists (bool): if True, looks the object up first and returns
+         it without committing when it already matches the given properties,
+         skipped when kwargs hold properties unknown to ucsmsdk
         **kwargs: Any additional key-value pair of managed object(MO)'s
                   property and value, which are not part of regular args.
                   This should be used for future version compatibility.
@@ -831,28 +876,104 @@ def ldap_provider_group_provider_add(handle, group_name, name,
                                         group_name="test_ldap_provider_group",
                                         name="test_ldap_provider",
                                         order="1")
-    """
-    from ucsmsdk.mometa.aaa.AaaProviderRef import AaaProviderRef
 
-    ldap_provider = ldap_provider_get(handle, name=name,
-                                    caller="ldap_provider_group_provider_add")
+        # several providers in one commit
+        with commit_batch(handle) as batch:
+            for name in ["test_ldap_provider1", "test_ldap_provider2"]:
+                ldap_provider_group_provider_add(
+                  batch, group_name="test_ldap_provider_group", name=name)
+    """
+    if check_exists and props_known(AaaProviderRef, kwargs):
+        mo_exists, mo = ldap_provider_group_provider_exists(
+            handle, group_name, name, order=order, descr=descr, **kwargs)
+        if mo_exists:
+            return mo
+
+    # resolve both parents in one request, the lookups below then come
+    # from the cache
+    resolve_dns(handle, [_provider_dn_get(name),
+                         _provider_group_dn_get(group_name)],
+                cached=True)
+    ldap_provider_get(handle, name=name,
+                      caller="ldap_provider_group_provider_add",
+                      cached=True)
 
     ldap_provider_group = ldap_provider_group_get(handle, name=group_name,
-                                    caller="ldap_provider_group_provider_add")
+                                    caller="ldap_provider_group_provider_add",
+                                    cached=True)
 
-    mo = AaaProviderRef(parent_mo_or_dn=ldap_provider_group,
+    mo = _ldap_provider_group_provider_add(handle, ldap_provider_group.dn,
+            name=name, order=order, descr=descr, **kwargs)
+    handle.commit()
+    return mo
+
+
+def _ldap_provider_group_provider_add(handle, group_dn, name,
+                                      order="lowest-available", descr=None,
+                                      **kwargs):
+    """
+    adds single provider to an ldap provider group without committing it
+    """
+    mo = AaaProviderRef(parent_mo_or_dn=group_dn,
                         name=name,
                         order=order,
                         descr=descr)
 
     mo.set_prop_multiple(**kwargs)
     handle.add_mo(mo, modify_present=True)
-    handle.commit()
     return mo
 
 
+def ldap_provider_group_provider_add_many(handle, group_name, providers):
+    """
+    adds multiple providers to an ldap provider group in a single commit
+
+    Args:
+        handle (UcsHandle)
+        group_name (string): ldap provider group name
+        providers (list of dict): each dict holds the arguments of
+         ldap_provider_group_provider_add, "name" is mandatory
+
+    Returns:
+        list of AaaProviderRef: managed objects
+
+    Raises:
+        UcsOperationError: if AaaProviderGroup or AaaProvider is not present
+         for any of the providers, in which case nothing is staged
+
+    Example:
+        providers = [{"name": "test_ldap_provider1", "order": "1"},
+                     {"name": "test_ldap_provider2", "order": "2"}]
+        ldap_provider_group_provider_add_many(handle,
+                                    group_name="test_prov_grp",
+                                    providers=providers)
+    """
+    caller = "ldap_provider_group_provider_add_many"
+    provider_dns = [_provider_dn_get(provider["name"])
+                    for provider in providers]
+    parents = resolve_dns(handle,
+                          [_provider_group_dn_get(group_name)] + provider_dns,
+                          cached=True)
+    ldap_provider_group = ldap_provider_group_get(handle, group_name,
+                                                  caller=caller,
+                                                  cached=True)
+    missing = [dn for dn in provider_dns if parents[dn] is None]
+    if missing:
+        raise UcsOperationError(caller,
+            "Ldap Providers '%s' do not exist" % ", ".join(missing))
+
+    mos = []
+    for provider in providers:
+        mos.append(_ldap_provider_group_provider_add(
+            handle, ldap_provider_group.dn, **provider))
+
+    handle.commit()
+    return mos
+
+
 def ldap_provider_group_provider_get(handle, group_name, name,
-                                    caller="ldap_provider_group_provider_get"):
+                                    caller="ldap_provider_group_provider_get",
+                                    must_exist=True):
     """
     Gets provider for ldap provider group
 
@@ -861,6 +982,8 @@ def ldap_provider_group_provider_get(handle, group_name, name,
         group_name (string): ldap provider group name
         name (string): ldap provider name
         caller (string): name of the caller function
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         AaaProviderRef : managed object
@@ -873,10 +996,9 @@ def ldap_provider_group_provider_get(handle, group_name, name,
                                          group_name="test_ldap_provider_group",
                                          name="test_provider")
     """
-    provider_group_dn = _ldap_dn+ "/providergroup-" + group_name
-    provider_ref_dn = provider_group_dn + "/provider-ref-" + name
+    provider_ref_dn = _provider_ref_dn_get(group_name, name)
     mo = handle.query_dn(provider_ref_dn)
-    if mo is None:
+    if mo is None and must_exist:
         raise UcsOperationError(caller,
             "Ldap Provider Reference '%s' does not exist" % provider_ref_dn)
     return mo
@@ -904,10 +1026,10 @@ def ldap_provider_group_provider_exists(handle, group_name, name, **kwargs):
         ldap_provider_group_provider_exists(handle,
                 group_name="test_ldap_provider_group", name="test_provider")
     """
-    try:
-        mo = ldap_provider_group_provider_get(handle, group_name, name,
-                                caller="ldap_provider_group_provider_exists")
-    except UcsOperationError:
+    mo = ldap_provider_group_provider_get(handle, group_name, name,
+                            caller="ldap_provider_group_provider_exists",
+                            must_exist=False)
+    if mo is None:
         return (False, None)
 
     if 'order' in kwargs and kwargs['order'] == 'lowest-available':
@@ -917,6 +1039,50 @@ def ldap_provider_group_provider_exists(handle, group_name, name, **kwargs):
     return (mo_exists, mo if mo_exists else None)
 
 
+def ldap_provider_group_provider_bulk_exists(handle, group_name, names,
+                                             **kwargs):
+    """
+    checks if multiple providers exist under a ldap provider group,
+    using a single query
+
+    Args:
+        handle (UcsHandle)
+        group_name (string): ldap provider group name
+        names (list of string): ldap provider names
+        **kwargs: key-value pair of managed object(MO) property and value, Use
+                  'print(ucscoreutils.get_meta_info(<classid>).config_props)'
+                  to get all configurable properties of class
+
+    Returns:
+        dict: provider name to (True/False, AaaProviderRef MO/None)
+
+    Raises:
+        None
+
+    Example:
+        ldap_provider_group_provider_bulk_exists(
+          handle, group_name="test_prov_grp",
+          names=["test_ldap_prov1", "test_ldap_prov2"])
+    """
+    if 'order' in kwargs and kwargs['order'] == 'lowest-available':
+        kwargs.pop('order', None)
+
+    group_dn = _provider_group_dn_get(group_name)
+    refs = dict((mo.name, mo) for mo in
+                handle.query_children(in_dn=group_dn,
+                                      class_id="AaaProviderRef"))
+    match = prop_matcher(AaaProviderRef, **kwargs)
+    result = {}
+    for name in names:
+        mo = refs.get(name)
+        if mo is None:
+            result[name] = (False, None)
+            continue
+        mo_exists = match(mo)
+        result[name] = (mo_exists, mo if mo_exists else None)
+    return result
+
+
 def ldap_provider_group_provider_modify(handle, group_name, name, **kwargs):
     """
     modify provider of ldap provider group
@@ -943,6 +1109,8 @@ def ldap_provider_group_provider_modify(handle, group_name, name, **kwargs):
     """
     mo = ldap_provider_group_provider_get(handle, group_name, name,
                                 caller="ldap_provider_group_provider_modify")
+    if not props_changed(mo, **kwargs):
+        return mo
     mo.set_prop_multiple(**kwargs)
     handle.set_mo(mo)
     handle.commit()
@@ -974,3 +1142,42 @@ def ldap_provider_group_provider_remove(handle, group_name, name):
 
     handle.remove_mo(mo)
     handle.commit()
+
+
+def ldap_provider_group_provider_remove_many(handle, group_name, names):
+    """
+    removes multiple providers from a ldap provider group in a single
+    commit
+
+    Args:
+        handle (UcsHandle)
+        group_name (string): ldap provider group name
+        names (list of string): ldap provider names
+
+    Returns:
+        None
+
+    Raises:
+        UcsOperationError: if any of the AaaProviderRef is not present, in
+         which case nothing is removed
+
+    Example:
+        ldap_provider_group_provider_remove_many(
+          handle, group_name="test_prov_grp",
+          names=["test_ldap_prov1", "test_ldap_prov2"])
+    """
+    caller = "ldap_provider_group_provider_remove_many"
+    group_dn = _provider_group_dn_get(group_name)
+    refs = dict((mo.name, mo) for mo in
+                handle.query_children(in_dn=group_dn,
+                                      class_id="AaaProviderRef"))
+    missing = [name for name in names if name not in refs]
+    if missing:
+        raise UcsOperationError(caller,
+            "Ldap Provider References '%s' do not exist under '%s'" %
+            (", ".join(missing), group_dn))
+
+    remove_mo = handle.remove_mo
+    for name in names:
+        remove_mo(refs[name])
+    handle.commit()
@@ -15,6 +15,9 @@
 This module performs the operation related to dns server management.
 """
 from ucsmsdk.ucsexception import UcsOperationError
+from ucsmsdk.mometa.aaa.AaaLocale import AaaLocale
+from ucsmsdk.mometa.aaa.AaaOrg import AaaOrg
+from ..utils.utils import props_changed, resolve_dns
 
 _base_dn = "sys/user-ext"
 
@@ -40,8 +43,6 @@ def locale_create(handle, name, policy_owner="local", descr=None, **kwargs):
     Example:
         locale_create(handle, name="test_locale")
     """
-    from ucsmsdk.mometa.aaa.AaaLocale import AaaLocale
-
     mo = AaaLocale(parent_mo_or_dn=_base_dn,
                    name=name,
                    policy_owner=policy_owner,
@@ -53,13 +54,15 @@ def locale_create(handle, name, policy_owner="local", descr=None, **kwargs):
     return mo
 
 
-def locale_get(handle, name, caller="locale_get"):
+def locale_get(handle, name, caller="locale_get", must_exist=True):
     """
     gets the locale
 
     Args:
         handle (UcsHandle)
         name (string): locale name
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         AaaLocale : managed object
@@ -70,9 +73,9 @@ def locale_get(handle, name, caller="locale_get"):
     Example:
         locale_get(handle, name="test_locale")
     """
-    dn = _base_dn + "/locale-" + name
+    dn = "%s/locale-%s" % (_base_dn, name)
     mo = handle.query_dn(dn)
-    if mo is None:
+    if mo is None and must_exist:
         raise UcsOperationError(caller, "Locale '%s' does not exist" % dn)
     return mo
 
@@ -97,9 +100,8 @@ def locale_exists(handle, name, **kwargs):
     Example:
         locale_exists(handle, name="test_locale")
     """
-    try:
-        mo = locale_get(handle, name, caller="locale_exists")
-    except UcsOperationError:
+    mo = locale_get(handle, name, caller="locale_exists", must_exist=False)
+    if mo is None:
         return (False, None)
     mo_exists = mo.check_prop_match(**kwargs)
     return (mo_exists, mo if mo_exists else None)
@@ -126,6 +128,8 @@ def locale_modify(handle, name, **kwargs):
         locale_modify(handle, name="test_locale", descr="testing locale")
     """
     mo = locale_get(handle, name, caller="locale_modify")
+    if not props_changed(mo, **kwargs):
+        return mo
     mo.set_prop_multiple(**kwargs)
     handle.set_mo(mo)
     handle.commit()
@@ -179,11 +183,15 @@ def locale_org_assign(handle, locale_name, name, org_dn="org-root", descr=None,
         locale_org_assign(handle, locale_name="test_locale",
                           name="test_org_assign")
     """
-    from ucsmsdk.mometa.aaa.AaaOrg import AaaOrg
+    locale_dn = "%s/locale-%s" % (_base_dn, locale_name)
+    mos = resolve_dns(handle, [locale_dn, org_dn])
 
-    locale = locale_get(handle, locale_name, caller="locale_org_assign")
+    locale = mos[locale_dn]
+    if locale is None:
+        raise UcsOperationError("locale_org_assign",
+                                "Locale '%s' does not exist" % locale_dn)
 
-    if not handle.query_dn(org_dn):
+    if mos[org_dn] is None:
         raise UcsOperationError("locale_org_assign",
                                  "org '%s' does not exist" % org_dn)
 
@@ -215,8 +223,7 @@ def locale_org_exists(handle, locale_name, name, **kwargs):
         locale_org_exists(handle, locale_name="test_locale,
                             name="org_name")
     """
-    locale_dn = _base_dn + "/locale-" + locale_name
-    dn = locale_dn + "/org-" + name
+    dn = "%s/locale-%s/org-%s" % (_base_dn, locale_name, name)
     mo = handle.query_dn(dn)
     if not mo:
         return False, None
@@ -244,8 +251,7 @@ def locale_org_unassign(handle, locale_name, name):
         locale_org_unassign(handle, locale_name="test_locale,
                             name="org_name")
     """
-    locale_dn = _base_dn + "/locale-" + locale_name
-    dn = locale_dn + "/org-" + name
+    dn = "%s/locale-%s/org-%s" % (_base_dn, locale_name, name)
     mo = handle.query_dn(dn)
     if not mo:
         raise UcsOperationError("locale_org_unassign",
@@ -15,12 +15,22 @@
 This module performs the operation related to radius configuration.
 """
 from ucsmsdk.ucsexception import UcsOperationError
+from ucsmsdk.mometa.aaa.AaaProviderGroup import AaaProviderGroup
+from ucsmsdk.mometa.aaa.AaaProviderRef import AaaProviderRef
+from ucsmsdk.mometa.aaa.AaaRadiusProvider import AaaRadiusProvider
+from ..utils.utils import prop_matcher, props_changed, props_known, \
+    query_dn_cached, query_dn_cache_clear, resolve_dns
 
 _radius_dn = "sys/radius-ext"
+_provider_dn_get = (_radius_dn + "/provider-{0}").format
+_provider_group_dn_get = (_radius_dn + "/providergroup-{0}").format
+_provider_ref_dn_get = (_radius_dn +
+                        "/providergroup-{0}/provider-ref-{1}").format
 
 def radius_provider_create(handle, name, order="lowest-available", key=None,
                            auth_port="1812", timeout="5", retries="1",
-                           enc_key=None, descr=None, **kwargs):
+                           enc_key=None, descr=None,
+                           check_exists=False, **kwargs):
     """
     Creates a radius provider
 
@@ -35,6 +45,9 @@ def radius_provider_create(handle, name, order="lowest-available", key=None,
         retries (string): retries
         enc_key (string): enc key
         descr (string): description
+        check_exists (bool): if True, looks the object up first and returns
+         it without committing when it already matches the given properties,
+         skipped when kwargs hold properties unknown to ucsmsdk
         **kwargs: Any additional key-value pair of managed object(MO)'s
                   property and value, which are not part of regular args.
                   This should be used for future version compatibility.
@@ -48,7 +61,13 @@ def radius_provider_create(handle, name, order="lowest-available", key=None,
         radius_provider_create(handle, name="test_radius_prov",
                                auth_port="320", timeout="10")
     """
-    from ucsmsdk.mometa.aaa.AaaRadiusProvider import AaaRadiusProvider
+    if check_exists and props_known(AaaRadiusProvider, kwargs):
+        mo_exists, mo = radius_provider_exists(
+            handle, name, order=order, key=key, auth_port=auth_port,
+            timeout=timeout, retries=retries, enc_key=enc_key, descr=descr,
+            **kwargs)
+        if mo_exists:
+            return mo
 
     mo = AaaRadiusProvider(
         parent_mo_or_dn=_radius_dn,
@@ -67,7 +86,8 @@ def radius_provider_create(handle, name, order="lowest-available", key=None,
     return mo
 
 
-def radius_provider_get(handle, name, caller="radius_provider_get"):
+def radius_provider_get(handle, name, caller="radius_provider_get",
+                        cached=False, must_exist=True):
     """
     gets radius provider
 
@@ -75,6 +95,10 @@ def radius_provider_get(handle, name, caller="radius_provider_get"):
         handle (UcsHandle)
         name (string): radius provider name
         caller (string): name of the caller function
+        cached (bool): reuse a recent lookup of the same object on this
+         handle, meant for parent lookups
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         AaaRadiusProvider: managed object
@@ -85,9 +109,12 @@ def radius_provider_get(handle, name, caller="radius_provider_get"):
     Example:
         radius_provider_get(handle, name="test_radius_provider")
     """
-    dn = _radius_dn + "/provider-" + name
-    mo = handle.query_dn(dn)
-    if mo is None:
+    dn = _provider_dn_get(name)
+    if cached:
+        mo = query_dn_cached(handle, dn)
+    else:
+        mo = handle.query_dn(dn)
+    if mo is None and must_exist:
         raise UcsOperationError(caller,
                                 "Radius Provider '%s' does not exist" % dn)
     return mo
@@ -113,9 +140,9 @@ def radius_provider_exists(handle, name, **kwargs):
     Example:
         radius_provider_exists(handle, name="test_radius_provider")
     """
-    try:
-        mo = radius_provider_get(handle, name, "radius_provider_exists")
-    except UcsOperationError:
+    mo = radius_provider_get(handle, name, "radius_provider_exists",
+                             must_exist=False)
+    if mo is None:
         return (False, None)
 
     if 'order' in kwargs and kwargs['order'] == 'lowest-available':
@@ -146,6 +173,8 @@ def radius_provider_modify(handle, name, **kwargs):
         radius_provider_modify(handle, name="test_radius_prov", timeout="5")
     """
     mo = radius_provider_get(handle, name, caller="radius_provider_modify")
+    if not props_changed(mo, **kwargs):
+        return mo
     mo.set_prop_multiple(**kwargs)
     handle.set_mo(mo)
     handle.commit()
@@ -172,6 +201,7 @@ def radius_provider_delete(handle, name):
     mo = radius_provider_get(handle, name, caller="radius_provider_delete")
     handle.remove_mo(mo)
     handle.commit()
+    query_dn_cache_clear(handle, mo.dn)
 
 
 def radius_provider_group_create(handle, name, descr=None, **kwargs):
@@ -195,8 +225,6 @@ def radius_provider_group_create(handle, name, descr=None, **kwargs):
     Example:
         radius_provider_group_create(handle, name="test_prov_grp")
     """
-    from ucsmsdk.mometa.aaa.AaaProviderGroup import AaaProviderGroup
-
     mo = AaaProviderGroup(parent_mo_or_dn=_radius_dn, name=name, descr=descr)
     mo.set_prop_multiple(**kwargs)
     handle.add_mo(mo, modify_present=True)
@@ -205,13 +233,18 @@ def radius_provider_group_create(handle, name, descr=None, **kwargs):
 
 
 def radius_provider_group_get(handle, name,
-                              caller="radius_provider_group_get"):
+                              caller="radius_provider_group_get",
+                              cached=False, must_exist=True):
     """
     gets radius provider group
 
     Args:
         handle (UcsHandle)
         name (string): radius provider group name
+        cached (bool): reuse a recent lookup of the same object on this
+         handle, meant for parent lookups
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         AaaProviderGroup: managed object
@@ -222,9 +255,12 @@ def radius_provider_group_get(handle, name,
     Example:
         radius_provider_group_get(handle, name="test_prov_grp")
     """
-    dn = _radius_dn + "/providergroup-" + name
-    mo = handle.query_dn(dn)
-    if mo is None:
+    dn = _provider_group_dn_get(name)
+    if cached:
+        mo = query_dn_cached(handle, dn)
+    else:
+        mo = handle.query_dn(dn)
+    if mo is None and must_exist:
         raise UcsOperationError(caller,
                             "Radius Provider Group'%s' does not exist" % dn)
     return mo
@@ -250,10 +286,10 @@ def radius_provider_group_exists(handle, name, **kwargs):
     Example:
         radius_provider_group_exists(handle, name="test_prov_grp")
     """
-    try:
-        mo = radius_provider_group_get(handle, name,
-                                       caller="radius_provider_group_exists")
-    except UcsOperationError:
+    mo = radius_provider_group_get(handle, name,
+                                   caller="radius_provider_group_exists",
+                                   must_exist=False)
+    if mo is None:
         return (False, None)
     mo_exists = mo.check_prop_match(**kwargs)
     return (mo_exists, mo if mo_exists else None)
@@ -280,11 +316,12 @@ def radius_provider_group_delete(handle, name):
                                    caller="radius_provider_group_delete")
     handle.remove_mo(mo)
     handle.commit()
+    query_dn_cache_clear(handle, mo.dn)
 
 
 def radius_provider_group_provider_add(handle, group_name, name,
                                        order="lowest-available", descr=None,
-                                       **kwargs):
+                                       check_exists=False, **kwargs):
     """
     adds a provider to a radius provider group
 
@@ -295,6 +332,9 @@ def radius_provider_group_provider_add(handle, group_name, name,
         order (string): order
          valid values are "lowest-available" or "0-16"
         descr (string): description
+        check_exists (bool): if True, looks the object up first and returns
+         it without committing when it already matches the given properties,
+         skipped when kwargs hold properties unknown to ucsmsdk
         **kwargs: Any additional key-value pair of managed object(MO)'s
                   property and value, which are not part of regular args.
                   This should be used for future version compatibility.
@@ -308,28 +348,104 @@ def radius_provider_group_provider_add(handle, group_name, name,
     Example:
         radius_provider_group_provider_add(
           handle, group_name="test_prov_grp", name="test_radius_prov")
-    """
-    from ucsmsdk.mometa.aaa.AaaProviderRef import AaaProviderRef
 
-    radius_provider = radius_provider_get(handle, name,
-                                caller="radius_provider_group_provider_add")
+        # several providers in one commit
+        with commit_batch(handle) as batch:
+            for name in ["test_radius_prov1", "test_radius_prov2"]:
+                radius_provider_group_provider_add(
+                  batch, group_name="test_prov_grp", name=name)
+    """
+    if check_exists and props_known(AaaProviderRef, kwargs):
+        mo_exists, mo = radius_provider_group_provider_exists(
+            handle, group_name, name, order=order, descr=descr, **kwargs)
+        if mo_exists:
+            return mo
+
+    # resolve both parents in one request, the lookups below then come
+    # from the cache
+    resolve_dns(handle, [_provider_dn_get(name),
+                         _provider_group_dn_get(group_name)],
+                cached=True)
+    radius_provider_get(handle, name,
+                        caller="radius_provider_group_provider_add",
+                        cached=True)
 
     radius_provider_group = radius_provider_group_get(handle, group_name,
-                                caller="radius_provider_group_provider_add")
+                                caller="radius_provider_group_provider_add",
+                                cached=True)
 
-    mo = AaaProviderRef(parent_mo_or_dn=radius_provider_group,
+    mo = _radius_provider_group_provider_add(handle, radius_provider_group.dn,
+            name=name, order=order, descr=descr, **kwargs)
+    handle.commit()
+    return mo
+
+
+def _radius_provider_group_provider_add(handle, group_dn, name,
+                                        order="lowest-available", descr=None,
+                                        **kwargs):
+    """
+    adds single provider to a radius provider group without committing it
+    """
+    mo = AaaProviderRef(parent_mo_or_dn=group_dn,
                         name=name,
                         order=order,
                         descr=descr)
 
     mo.set_prop_multiple(**kwargs)
     handle.add_mo(mo, modify_present=True)
-    handle.commit()
     return mo
 
 
+def radius_provider_group_provider_add_many(handle, group_name, providers):
+    """
+    adds multiple providers to a radius provider group in a single commit
+
+    Args:
+        handle (UcsHandle)
+        group_name (string): radius provider group name
+        providers (list of dict): each dict holds the arguments of
+         radius_provider_group_provider_add, "name" is mandatory
+
+    Returns:
+        list of AaaProviderRef: managed objects
+
+    Raises:
+        UcsOperationError: if AaaProviderGroup or AaaProvider is not present
+         for any of the providers, in which case nothing is staged
+
+    Example:
+        providers = [{"name": "test_radius_prov1", "order": "1"},
+                     {"name": "test_radius_prov2", "order": "2"}]
+        radius_provider_group_provider_add_many(handle,
+                                    group_name="test_prov_grp",
+                                    providers=providers)
+    """
+    caller = "radius_provider_group_provider_add_many"
+    provider_dns = [_provider_dn_get(provider["name"])
+                    for provider in providers]
+    parents = resolve_dns(handle,
+                          [_provider_group_dn_get(group_name)] + provider_dns,
+                          cached=True)
+    radius_provider_group = radius_provider_group_get(handle, group_name,
+                                                      caller=caller,
+                                                      cached=True)
+    missing = [dn for dn in provider_dns if parents[dn] is None]
+    if missing:
+        raise UcsOperationError(caller,
+            "Radius Providers '%s' do not exist" % ", ".join(missing))
+
+    mos = []
+    for provider in providers:
+        mos.append(_radius_provider_group_provider_add(
+            handle, radius_provider_group.dn, **provider))
+
+    handle.commit()
+    return mos
+
+
 def radius_provider_group_provider_get(handle, group_name, name,
-                                caller="radius_provider_group_provider_get"):
+                                caller="radius_provider_group_provider_get",
+                                must_exist=True):
     """
     gets provider  under a radius provider group
 
@@ -337,6 +453,8 @@ def radius_provider_group_provider_get(handle, group_name, name,
         handle (UcsHandle)
         group_name (string): radius provider group name
         name (string): radius provider name
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         AaaProviderRef: managed object
@@ -349,10 +467,9 @@ def radius_provider_group_provider_get(handle, group_name, name,
                                     group_name="test_radius_provider_group",
                                     name="test_radius_provider")
     """
-    provider_group_dn = _radius_dn + "/providergroup-" + group_name
-    provider_ref_dn = provider_group_dn + "/provider-ref-" + name
+    provider_ref_dn = _provider_ref_dn_get(group_name, name)
     mo = handle.query_dn(provider_ref_dn)
-    if mo is None:
+    if mo is None and must_exist:
         raise UcsOperationError(caller,
             "Radius Provider Reference '%s' does not exist" % provider_ref_dn)
     return mo
@@ -381,10 +498,10 @@ def radius_provider_group_provider_exists(handle, group_name, name, **kwargs):
                                     group_name="test_radius_provider_group",
                                     name="test_radius_provider")
     """
-    try:
-        mo = radius_provider_group_provider_get(handle, group_name, name,
-                            caller="radius_provider_group_provider_exists")
-    except UcsOperationError:
+    mo = radius_provider_group_provider_get(handle, group_name, name,
+                        caller="radius_provider_group_provider_exists",
+                        must_exist=False)
+    if mo is None:
         return (False, None)
 
     if 'order' in kwargs and kwargs['order'] == 'lowest-available':
@@ -394,6 +511,50 @@ def radius_provider_group_provider_exists(handle, group_name, name, **kwargs):
     return (mo_exists, mo if mo_exists else None)
 
 
+def radius_provider_group_provider_bulk_exists(handle, group_name, names,
+                                               **kwargs):
+    """
+    checks if multiple providers exist under a radius provider group,
+    using a single query
+
+    Args:
+        handle (UcsHandle)
+        group_name (string): radius provider group name
+        names (list of string): radius provider names
+        **kwargs: key-value pair of managed object(MO) property and value, Use
+                  'print(ucscoreutils.get_meta_info(<classid>).config_props)'
+                  to get all configurable properties of class
+
+    Returns:
+        dict: provider name to (True/False, AaaProviderRef MO/None)
+
+    Raises:
+        None
+
+    Example:
+        radius_provider_group_provider_bulk_exists(
+          handle, group_name="test_prov_grp",
+          names=["test_radius_prov1", "test_radius_prov2"])
+    """
+    if 'order' in kwargs and kwargs['order'] == 'lowest-available':
+        kwargs.pop('order', None)
+
+    group_dn = _provider_group_dn_get(group_name)
+    refs = dict((mo.name, mo) for mo in
+                handle.query_children(in_dn=group_dn,
+                                      class_id="AaaProviderRef"))
+    match = prop_matcher(AaaProviderRef, **kwargs)
+    result = {}
+    for name in names:
+        mo = refs.get(name)
+        if mo is None:
+            result[name] = (False, None)
+            continue
+        mo_exists = match(mo)
+        result[name] = (mo_exists, mo if mo_exists else None)
+    return result
+
+
 def radius_provider_group_provider_modify(handle, group_name, name, **kwargs):
     """
     modifies a provider to a radius provider group
@@ -419,6 +580,8 @@ def radius_provider_group_provider_modify(handle, group_name, name, **kwargs):
     """
     mo = radius_provider_group_provider_get(handle, group_name, name,
                             caller="radius_provider_group_provider_modify")
+    if not props_changed(mo, **kwargs):
+        return mo
     mo.set_prop_multiple(**kwargs)
     handle.set_mo(mo)
     handle.commit()
@@ -449,3 +612,42 @@ def radius_provider_group_provider_remove(handle, group_name, name):
                                 caller="radius_provider_group_provider_remove")
     handle.remove_mo(mo)
     handle.commit()
+
+
+def radius_provider_group_provider_remove_many(handle, group_name, names):
+    """
+    removes multiple providers from a radius provider group in a single
+    commit
+
+    Args:
+        handle (UcsHandle)
+        group_name (string): radius provider group name
+        names (list of string): radius provider names
+
+    Returns:
+        None
+
+    Raises:
+        UcsOperationError: if any of the AaaProviderRef is not present, in
+         which case nothing is removed
+
+    Example:
+        radius_provider_group_provider_remove_many(
+          handle, group_name="test_prov_grp",
+          names=["test_radius_prov1", "test_radius_prov2"])
+    """
+    caller = "radius_provider_group_provider_remove_many"
+    group_dn = _provider_group_dn_get(group_name)
+    refs = dict((mo.name, mo) for mo in
+                handle.query_children(in_dn=group_dn,
+                                      class_id="AaaProviderRef"))
+    missing = [name for name in names if name not in refs]
+    if missing:
+        raise UcsOperationError(caller,
+            "Radius Provider References '%s' do not exist under '%s'" %
+            (", ".join(missing), group_dn))
+
+    remove_mo = handle.remove_mo
+    for name in names:
+        remove_mo(refs[name])
+    handle.commit()
@@ -15,6 +15,8 @@
 This module performs the operation related to role.
 """
 from ucsmsdk.ucsexception import UcsOperationError
+from ucsmsdk.mometa.aaa.AaaRole import AaaRole
+from ..utils.utils import props_changed
 
 _user_dn = "sys/user-ext"
 
@@ -53,8 +55,6 @@ def role_create(handle, name, priv="read-only", policy_owner="local",
     Example:
         role_create(handle, name="test_role", priv="admin")
     """
-    from ucsmsdk.mometa.aaa.AaaRole import AaaRole
-
     mo = AaaRole(parent_mo_or_dn=_user_dn,
                  name=name,
                  priv=priv,
@@ -67,7 +67,7 @@ def role_create(handle, name, priv="read-only", policy_owner="local",
     return mo
 
 
-def role_get(handle, name, caller="role_get"):
+def role_get(handle, name, caller="role_get", must_exist=True):
     """
     gets a role
 
@@ -75,6 +75,8 @@ def role_get(handle, name, caller="role_get"):
         handle (UcsHandle)
         name (string): role name
         caller (string): name of the caller function
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         AaaRole: managed object
@@ -85,9 +87,9 @@ def role_get(handle, name, caller="role_get"):
     Example:
         role_get(handle, name="test_role")
     """
-    dn = _user_dn + "/role-" + name
+    dn = "%s/role-%s" % (_user_dn, name)
     mo = handle.query_dn(dn)
-    if mo is None:
+    if mo is None and must_exist:
         raise UcsOperationError(caller, "Role '%s' does not exist" % dn)
     return mo
 
@@ -112,9 +114,8 @@ def role_exists(handle, name, **kwargs):
     Example:
         role_exists(handle, name="test_role", priv="read-only")
     """
-    try:
-        mo = role_get(handle, name, "role_exists")
-    except UcsOperationError:
+    mo = role_get(handle, name, "role_exists", must_exist=False)
+    if mo is None:
         return (False, None)
     mo_exists = mo.check_prop_match(**kwargs)
     return (mo_exists, mo if mo_exists else None)
@@ -141,6 +142,8 @@ def role_modify(handle, name, **kwargs):
         role_modify(handle, name="test_role", priv="read-only")
     """
     mo = role_get(handle, name, "role_modify")
+    if not props_changed(mo, **kwargs):
+        return mo
     mo.set_prop_multiple(**kwargs)
     handle.set_mo(mo)
     handle.commit()
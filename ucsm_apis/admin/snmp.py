@@ -15,16 +15,22 @@
 This module performs the operation related to snmp server, user and traps.
 """
 from ucsmsdk.ucsexception import UcsOperationError
+from ucsmsdk.mometa.comm.CommSnmp import CommSnmpConsts
+from ucsmsdk.mometa.comm.CommSnmpTrap import CommSnmpTrap
+from ucsmsdk.mometa.comm.CommSnmpUser import CommSnmpUser
+from ..utils.utils import props_changed
 
 _base_dn = "sys/svc-ext"
 
-def snmp_config_get(handle, caller="snmp_config_get"):
+def snmp_config_get(handle, caller="snmp_config_get", must_exist=True):
     """
     gets snmp config
 
     Args:
         handle (UcsHandle)
         caller (string): name of the caller function
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         CommSnmp: managed object
@@ -37,7 +43,7 @@ def snmp_config_get(handle, caller="snmp_config_get"):
     """
     dn = _base_dn + "/snmp-svc"
     mo = handle.query_dn(dn)
-    if mo is None:
+    if mo is None and must_exist:
         raise UcsOperationError(caller,
                                 "SNMP Config '%s' does not exist." % dn)
     return mo
@@ -76,8 +82,6 @@ def snmp_enable(handle, policy_owner="local", is_set_snmp_secure="no",
                          descr="SNMP Service")
 
     """
-    from ucsmsdk.mometa.comm.CommSnmp import CommSnmpConsts
-
     mo = snmp_config_get(handle, caller="snmp_enable")
 
     args = {'admin_state': CommSnmpConsts.ADMIN_STATE_ENABLED,
@@ -113,8 +117,6 @@ def snmp_disable(handle):
     Example:
         snmp_disable(handle)
     """
-    from ucsmsdk.mometa.comm.CommSnmp import CommSnmpConsts
-
     mo = snmp_config_get(handle, "snmp_disable")
 
     args = {'admin_state': CommSnmpConsts.ADMIN_STATE_DISABLED}
@@ -150,11 +152,8 @@ def snmp_exists(handle, **kwargs):
                          descr="SNMP Service")
 
     """
-    from ucsmsdk.mometa.comm.CommSnmp import CommSnmpConsts
-
-    try:
-        mo = snmp_config_get(handle, caller="snmp_exists")
-    except UcsOperationError:
+    mo = snmp_config_get(handle, caller="snmp_exists", must_exist=False)
+    if mo is None:
         return (False, None)
 
     kwargs['admin_state'] = CommSnmpConsts.ADMIN_STATE_ENABLED
@@ -198,8 +197,6 @@ def snmp_trap_add(handle, hostname, community, port="162", version="v2c",
                       version="v2c",
                       notification_type="informs")
     """
-    from ucsmsdk.mometa.comm.CommSnmpTrap import CommSnmpTrap
-
     if version == 'v1':
         notification_type = 'traps'
 
@@ -218,7 +215,7 @@ def snmp_trap_add(handle, hostname, community, port="162", version="v2c",
     return mo
 
 
-def snmp_trap_get(handle, hostname, caller="snmp_trap_get"):
+def snmp_trap_get(handle, hostname, caller="snmp_trap_get", must_exist=True):
     """
     gets snmp trap
 
@@ -226,6 +223,8 @@ def snmp_trap_get(handle, hostname, caller="snmp_trap_get"):
         handle (UcsHandle)
         hostname (string): hostname or ip address
         caller (string): name of the caller function
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         CommSnmpTrap: managed object
@@ -236,9 +235,9 @@ def snmp_trap_get(handle, hostname, caller="snmp_trap_get"):
     Example:
         snmp_trap_get(handle, hostname="10.10.10.10")
     """
-    dn = _base_dn + "/snmp-svc" + "/snmp-trap" + hostname
+    dn = "%s/snmp-svc/snmp-trap%s" % (_base_dn, hostname)
     mo = handle.query_dn(dn)
-    if mo is None:
+    if mo is None and must_exist:
         raise UcsOperationError(caller, "SNMP Trap '%s' does not exist" % dn)
     return mo
 
@@ -266,9 +265,9 @@ def snmp_trap_exists(handle, hostname, **kwargs):
                          version="v2c",
                          notification_type="informs")
     """
-    try:
-        mo = snmp_trap_get(handle, hostname, caller="snmp_trap_exists")
-    except UcsOperationError:
+    mo = snmp_trap_get(handle, hostname, caller="snmp_trap_exists",
+                       must_exist=False)
+    if mo is None:
         return (False, None)
 
 
@@ -304,6 +303,8 @@ def snmp_trap_modify(handle, hostname, **kwargs):
                          v3_privilege="noauth")
     """
     mo = snmp_trap_get(handle, hostname, caller="snmp_trap_modify")
+    if not props_changed(mo, **kwargs):
+        return mo
     mo.set_prop_multiple(**kwargs)
     handle.set_mo(mo)
     handle.commit()
@@ -360,8 +361,6 @@ def snmp_user_add(handle, name, pwd, auth="md5", use_aes="no",
         snmp_user_add(handle, name="snmpuser", descr=None, pwd="password",
                       privpwd="password", auth="sha")
     """
-    from ucsmsdk.mometa.comm.CommSnmpUser import CommSnmpUser
-
     mo = CommSnmpUser(
         parent_mo_or_dn=_base_dn + "/snmp-svc",
         name=name,
@@ -377,7 +376,7 @@ def snmp_user_add(handle, name, pwd, auth="md5", use_aes="no",
     return mo
 
 
-def snmp_user_get(handle, name, caller="snmp_user_get"):
+def snmp_user_get(handle, name, caller="snmp_user_get", must_exist=True):
     """
     gets snmp user.
 
@@ -385,6 +384,8 @@ def snmp_user_get(handle, name, caller="snmp_user_get"):
         handle (UcsHandle)
         name (string): snmp username
         caller (string): name of the caller function
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         CommSnmpUser: managed object
@@ -395,9 +396,9 @@ def snmp_user_get(handle, name, caller="snmp_user_get"):
     Example:
         snmp_user_get(handle, name="snmpuser")
     """
-    dn = _base_dn + "/snmp-svc" + "/snmpv3-user-" + name
+    dn = "%s/snmp-svc/snmpv3-user-%s" % (_base_dn, name)
     mo = handle.query_dn(dn)
-    if mo is None:
+    if mo is None and must_exist:
         raise UcsOperationError(caller, "SNMP User '%s' does not exist" % dn)
     return mo
 
@@ -423,9 +424,9 @@ def snmp_user_exists(handle, name, **kwargs):
         snmp_user_exists(handle, name="snmpuser", descr=None,
                     auth="sha")
     """
-    try:
-        mo = snmp_user_get(handle, name, caller="snmp_user_exists")
-    except UcsOperationError:
+    mo = snmp_user_get(handle, name, caller="snmp_user_exists",
+                       must_exist=False)
+    if mo is None:
         return (False, None)
 
     if 'pwd' in kwargs:
@@ -460,6 +461,8 @@ def snmp_user_modify(handle, name, **kwargs):
                           auth="md5", use_aes="no")
     """
     mo = snmp_user_get(handle, name, caller="snmp_user_modify")
+    if not props_changed(mo, **kwargs):
+        return mo
     mo.set_prop_multiple(**kwargs)
     handle.set_mo(mo)
     handle.commit()
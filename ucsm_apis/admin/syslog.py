@@ -14,6 +14,10 @@
 This module performs the operation related to syslog.
 """
 from ucsmsdk.ucsexception import UcsOperationError
+from ucsmsdk.mometa.comm.CommSyslogClient import CommSyslogClientConsts
+from ucsmsdk.mometa.comm.CommSyslogConsole import CommSyslogConsoleConsts
+from ucsmsdk.mometa.comm.CommSyslogFile import CommSyslogFileConsts
+from ucsmsdk.mometa.comm.CommSyslogMonitor import CommSyslogMonitorConsts
 
 _syslog_dn = "sys/svc-ext/syslog"
 
@@ -40,9 +44,6 @@ def syslog_local_console_enable(handle, severity="emergencies",
     Example:
         syslog_local_console_enable(handle, severity="alerts")
     """
-    from ucsmsdk.mometa.comm.CommSyslogConsole import \
-        CommSyslogConsoleConsts
-
     dn = _syslog_dn + "/console"
     mo = handle.query_dn(dn)
     if not mo:
@@ -78,9 +79,6 @@ def syslog_local_console_disable(handle):
     Example:
         syslog_local_console_disable(handle)
     """
-    from ucsmsdk.mometa.comm.CommSyslogConsole import \
-        CommSyslogConsoleConsts
-
     dn = _syslog_dn + "/console"
     mo = handle.query_dn(dn)
     if not mo:
@@ -111,9 +109,6 @@ def syslog_local_console_exists(handle, **kwargs):
     Example:
         syslog_local_console_exists(handle, severity="alerts")
     """
-    from ucsmsdk.mometa.comm.CommSyslogConsole import \
-        CommSyslogConsoleConsts
-
     dn = _syslog_dn + "/console"
     mo = handle.query_dn(dn)
     if not mo:
@@ -150,9 +145,6 @@ def syslog_local_monitor_enable(handle, severity="emergencies",
     Example:
         syslog_local_monitor_enable(handle, severity="alerts")
     """
-    from ucsmsdk.mometa.comm.CommSyslogMonitor import \
-        CommSyslogMonitorConsts
-
     dn = _syslog_dn + "/monitor"
     mo = handle.query_dn(dn)
     if not mo:
@@ -188,9 +180,6 @@ def syslog_local_monitor_disable(handle):
     Example:
         mo = syslog_local_monitor_disable(handle)
     """
-    from ucsmsdk.mometa.comm.CommSyslogMonitor import \
-        CommSyslogMonitorConsts
-
     dn = _syslog_dn + "/monitor"
     mo = handle.query_dn(dn)
     if not mo:
@@ -221,9 +210,6 @@ def syslog_local_monitor_exists(handle, **kwargs):
     Example:
         syslog_local_monitor_exists(handle, severity="alerts")
     """
-    from ucsmsdk.mometa.comm.CommSyslogMonitor import \
-        CommSyslogMonitorConsts
-
     dn = _syslog_dn + "/monitor"
     mo = handle.query_dn(dn)
     if not mo:
@@ -262,8 +248,6 @@ def syslog_local_file_enable(handle, severity="emergencies", size=None,
         syslog_local_file_enable(handle, severity="alert", size="435675",
                                 name="sys_log")
     """
-    from ucsmsdk.mometa.comm.CommSyslogFile import CommSyslogFileConsts
-
     dn = _syslog_dn + "/file"
     mo = handle.query_dn(dn)
     if not mo:
@@ -301,8 +285,6 @@ def syslog_local_file_disable(handle):
     Example:
         syslog_local_file_disable(handle)
     """
-    from ucsmsdk.mometa.comm.CommSyslogFile import CommSyslogFileConsts
-
     dn = _syslog_dn + "/file"
     mo = handle.query_dn(dn)
     if not mo:
@@ -333,8 +315,6 @@ def syslog_local_file_exists(handle, **kwargs):
     Example:
         syslog_local_file_exists(handle, severity="alerts")
     """
-    from ucsmsdk.mometa.comm.CommSyslogFile import CommSyslogFileConsts
-
     dn = _syslog_dn + "/file"
     mo = handle.query_dn(dn)
     if not mo:
@@ -375,10 +355,7 @@ def syslog_remote_enable(handle, name, hostname, severity="emergencies",
         syslog_remote_enable(handle, name="primary", hostname="192.168.1.2",
                              severity="alert")
     """
-    from ucsmsdk.mometa.comm.CommSyslogClient import \
-        CommSyslogClientConsts
-
-    dn = _syslog_dn + "/client-" + name
+    dn = "%s/client-%s" % (_syslog_dn, name)
     mo = handle.query_dn(dn)
     if not mo:
         raise UcsOperationError("syslog_remote_enable",
@@ -416,10 +393,7 @@ def syslog_remote_disable(handle, name):
     Example:
         syslog_remote_disable(handle, name="primary")
     """
-    from ucsmsdk.mometa.comm.CommSyslogClient import \
-        CommSyslogClientConsts
-
-    dn = _syslog_dn + "/client-" + name
+    dn = "%s/client-%s" % (_syslog_dn, name)
     mo = handle.query_dn(dn)
     if not mo:
         raise UcsOperationError("syslog_remote_disable",
@@ -452,10 +426,7 @@ def syslog_remote_exists(handle, name, **kwargs):
         syslog_remote_exists(handle, name="primary", hostname="192.168.1.2",
                              severity="alert")
     """
-    from ucsmsdk.mometa.comm.CommSyslogClient import \
-        CommSyslogClientConsts
-
-    dn = _syslog_dn + "/client-" + name
+    dn = "%s/client-%s" % (_syslog_dn, name)
     mo = handle.query_dn(dn)
     if not mo:
         return False, None
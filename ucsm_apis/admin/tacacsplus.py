@@ -14,12 +14,22 @@
 This module performs the operation related to dns server management.
 """
 from ucsmsdk.ucsexception import UcsOperationError
+from ucsmsdk.mometa.aaa.AaaProviderGroup import AaaProviderGroup
+from ucsmsdk.mometa.aaa.AaaProviderRef import AaaProviderRef
+from ucsmsdk.mometa.aaa.AaaTacacsPlusProvider import AaaTacacsPlusProvider
+from ..utils.utils import prop_matcher, props_changed, props_known, \
+    query_dn_cached, query_dn_cache_clear, resolve_dns
 
 _tacacs_dn = "sys/tacacs-ext"
+_provider_dn_get = (_tacacs_dn + "/provider-{0}").format
+_provider_group_dn_get = (_tacacs_dn + "/providergroup-{0}").format
+_provider_ref_dn_get = (_tacacs_dn +
+                        "/providergroup-{0}/provider-ref-{1}").format
 
 def tacacsplus_provider_create(handle, name, order="lowest-available",
                                port="49", timeout="5", retries="1",
-                               key=None, enc_key=None, descr=None, **kwargs):
+                               key=None, enc_key=None, descr=None,
+                               check_exists=False, **kwargs):
     """
     creates a tacacsplus provider
 
@@ -34,6 +44,9 @@ def tacacsplus_provider_create(handle, name, order="lowest-available",
         key (string): key
         enc_key (string): enc_key
         descr (string): description
+        check_exists (bool): if True, looks the object up first and returns
+         it without committing when it already matches the given properties,
+         skipped when kwargs hold properties unknown to ucsmsdk
         **kwargs: Any additional key-value pair of managed object(MO)'s
                   property and value, which are not part of regular args.
                   This should be used for future version compatibility.
@@ -48,8 +61,13 @@ def tacacsplus_provider_create(handle, name, order="lowest-available",
         tacacsplus_provider_create(
           handle, name="test_tacac_prov", port="320", timeout="10")
     """
-    from ucsmsdk.mometa.aaa.AaaTacacsPlusProvider import \
-        AaaTacacsPlusProvider
+    if check_exists and props_known(AaaTacacsPlusProvider, kwargs):
+        mo_exists, mo = tacacsplus_provider_exists(
+            handle, name, order=order, port=port, timeout=timeout,
+            retries=retries, key=key, enc_key=enc_key, descr=descr,
+            **kwargs)
+        if mo_exists:
+            return mo
 
     mo = AaaTacacsPlusProvider(parent_mo_or_dn=_tacacs_dn,
                                name=name,
@@ -67,7 +85,8 @@ def tacacsplus_provider_create(handle, name, order="lowest-available",
     return mo
 
 
-def tacacsplus_provider_get(handle, name, caller="tacacsplus_provider_get"):
+def tacacsplus_provider_get(handle, name, caller="tacacsplus_provider_get",
+                            cached=False, must_exist=True):
     """
     gets tacacsplus provider
 
@@ -75,6 +94,10 @@ def tacacsplus_provider_get(handle, name, caller="tacacsplus_provider_get"):
         handle (UcsHandle)
         name (string): tacacsplus provider name
         caller (string): name of the caller function
+        cached (bool): reuse a recent lookup of the same object on this
+         handle, meant for parent lookups
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         AaaTacacsPlusProvider: managed object
@@ -85,9 +108,12 @@ def tacacsplus_provider_get(handle, name, caller="tacacsplus_provider_get"):
     Example:
         tacacsplus_provider_get(handle, name="test_tacac_prov")
     """
-    dn = _tacacs_dn + "/provider-" + name
-    mo = handle.query_dn(dn)
-    if mo is None:
+    dn = _provider_dn_get(name)
+    if cached:
+        mo = query_dn_cached(handle, dn)
+    else:
+        mo = handle.query_dn(dn)
+    if mo is None and must_exist:
         raise UcsOperationError(caller,
                                 "Tacacsplus Provider '%s' does not exist" % dn)
     return mo
@@ -113,10 +139,10 @@ def tacacsplus_provider_exists(handle, name, **kwargs):
     Example:
         tacacsplus_provider_exists(handle, name="test_tacac_prov", port="320")
     """
-    try:
-        mo = tacacsplus_provider_get(handle, name,
-                                     caller="tacacsplus_provider_exists")
-    except UcsOperationError:
+    mo = tacacsplus_provider_get(handle, name,
+                                 caller="tacacsplus_provider_exists",
+                                 must_exist=False)
+    if mo is None:
         return (False, None)
 
     if 'order' in kwargs and kwargs['order'] == 'lowest-available':
@@ -148,7 +174,8 @@ def tacacsplus_provider_modify(handle, name, **kwargs):
     """
     mo = tacacsplus_provider_get(handle, name,
                                  caller="tacacsplus_provider_modify")
-
+    if not props_changed(mo, **kwargs):
+        return mo
     mo.set_prop_multiple(**kwargs)
     handle.set_mo(mo)
     handle.commit()
@@ -176,6 +203,7 @@ def tacacsplus_provider_delete(handle, name):
                                  caller="tacacsplus_provider_delete")
     handle.remove_mo(mo)
     handle.commit()
+    query_dn_cache_clear(handle, mo.dn)
 
 
 def tacacsplus_provider_group_create(handle, name, descr=None, **kwargs):
@@ -199,8 +227,6 @@ def tacacsplus_provider_group_create(handle, name, descr=None, **kwargs):
     Example:
         tacacsplus_provider_group_create(handle, name="test_prov_grp")
     """
-    from ucsmsdk.mometa.aaa.AaaProviderGroup import AaaProviderGroup
-
     mo = AaaProviderGroup(parent_mo_or_dn=_tacacs_dn, name=name, descr=descr)
     mo.set_prop_multiple(**kwargs)
     handle.add_mo(mo, modify_present=True)
@@ -209,7 +235,8 @@ def tacacsplus_provider_group_create(handle, name, descr=None, **kwargs):
 
 
 def tacacsplus_provider_group_get(handle, name,
-                                  caller="tacacsplus_provider_group_get"):
+                                  caller="tacacsplus_provider_group_get",
+                                  cached=False, must_exist=True):
     """
     gets tacacsplus provider group
 
@@ -217,6 +244,10 @@ def tacacsplus_provider_group_get(handle, name,
         handle (UcsHandle)
         name (string): tacacsplus provider group name
         caller (string): name of the caller function
+        cached (bool): reuse a recent lookup of the same object on this
+         handle, meant for parent lookups
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         AaaProviderGroup: managed object
@@ -227,9 +258,12 @@ def tacacsplus_provider_group_get(handle, name,
     Example:
         tacacsplus_provider_group_get(handle, name="test_prov_grp")
     """
-    dn = _tacacs_dn + "/providergroup-" + name
-    mo = handle.query_dn(dn)
-    if mo is None:
+    dn = _provider_group_dn_get(name)
+    if cached:
+        mo = query_dn_cached(handle, dn)
+    else:
+        mo = handle.query_dn(dn)
+    if mo is None and must_exist:
         raise UcsOperationError(caller,
                         "Tacacsplus  Provider Group '%s' does not exist" % dn)
     return mo
@@ -255,10 +289,10 @@ def tacacsplus_provider_group_exists(handle, name, **kwargs):
     Example:
         tacacsplus_provider_group_exists(handle, name="test_prov_grp")
     """
-    try:
-        mo = tacacsplus_provider_group_get(handle, name,
-                                    caller="tacacsplus_provider_group_exists")
-    except UcsOperationError:
+    mo = tacacsplus_provider_group_get(handle, name,
+                                caller="tacacsplus_provider_group_exists",
+                                must_exist=False)
+    if mo is None:
         return (False, None)
     mo_exists = mo.check_prop_match(**kwargs)
     return (mo_exists, mo if mo_exists else None)
@@ -285,11 +319,13 @@ def tacacsplus_provider_group_delete(handle, name):
                                     caller="tacacsplus_provider_group_delete")
     handle.remove_mo(mo)
     handle.commit()
+    query_dn_cache_clear(handle, mo.dn)
 
 
 def tacacsplus_provider_group_provider_add(handle, group_name, name,
                                            order="lowest-available",
-                                           descr=None, **kwargs):
+                                           descr=None, check_exists=False,
+                                           **kwargs):
     """
     adds a tacacsplus provider to a tacacsplus provider group
 
@@ -300,6 +336,9 @@ def tacacsplus_provider_group_provider_add(handle, group_name, name,
         order (string): order
          valid values are "lowest-available" or "0-16"
         descr (string): description
+        check_exists (bool): if True, looks the object up first and returns
+         it without committing when it already matches the given properties,
+         skipped when kwargs hold properties unknown to ucsmsdk
         **kwargs: Any additional key-value pair of managed object(MO)'s
                   property and value, which are not part of regular args.
                   This should be used for future version compatibility.
@@ -314,28 +353,105 @@ def tacacsplus_provider_group_provider_add(handle, group_name, name,
         tacacsplus_provider_group_provider_add(handle,
                                                group_name="test_prov_grp",
                                                name="test_tacac_prov")
-    """
-    from ucsmsdk.mometa.aaa.AaaProviderRef import AaaProviderRef
 
-    tacacsplus_provider = tacacsplus_provider_get(handle, name,
-                            caller="tacacsplus_provider_group_provider_add")
+        # several providers in one commit
+        with commit_batch(handle) as batch:
+            for name in ["test_tacac_prov1", "test_tacac_prov2"]:
+                tacacsplus_provider_group_provider_add(
+                  batch, group_name="test_prov_grp", name=name)
+    """
+    if check_exists and props_known(AaaProviderRef, kwargs):
+        mo_exists, mo = tacacsplus_provider_group_provider_exists(
+            handle, group_name, name, order=order, descr=descr, **kwargs)
+        if mo_exists:
+            return mo
+
+    # resolve both parents in one request, the lookups below then come
+    # from the cache
+    resolve_dns(handle, [_provider_dn_get(name),
+                         _provider_group_dn_get(group_name)],
+                cached=True)
+    tacacsplus_provider_get(handle, name,
+                            caller="tacacsplus_provider_group_provider_add",
+                            cached=True)
 
     tacacsplus_provider_group = tacacsplus_provider_group_get(handle,
-                group_name, caller="tacacsplus_provider_group_provider_add")
+                group_name, caller="tacacsplus_provider_group_provider_add",
+                cached=True)
 
-    mo = AaaProviderRef(parent_mo_or_dn=tacacsplus_provider_group,
+    mo = _tacacsplus_provider_group_provider_add(handle,
+            tacacsplus_provider_group.dn, name=name, order=order, descr=descr,
+            **kwargs)
+    handle.commit()
+    return mo
+
+
+def _tacacsplus_provider_group_provider_add(handle, group_dn, name,
+                                            order="lowest-available",
+                                            descr=None, **kwargs):
+    """
+    adds single provider to a tacacsplus provider group without committing it
+    """
+    mo = AaaProviderRef(parent_mo_or_dn=group_dn,
                         name=name,
                         order=order,
                         descr=descr)
 
     mo.set_prop_multiple(**kwargs)
     handle.add_mo(mo, modify_present=True)
-    handle.commit()
     return mo
 
 
+def tacacsplus_provider_group_provider_add_many(handle, group_name, providers):
+    """
+    adds multiple providers to a tacacsplus provider group in a single commit
+
+    Args:
+        handle (UcsHandle)
+        group_name (string): tacacsplus provider group name
+        providers (list of dict): each dict holds the arguments of
+         tacacsplus_provider_group_provider_add, "name" is mandatory
+
+    Returns:
+        list of AaaProviderRef: managed objects
+
+    Raises:
+        UcsOperationError: if AaaProviderGroup or AaaProvider is not present
+         for any of the providers, in which case nothing is staged
+
+    Example:
+        providers = [{"name": "test_tacac_prov1", "order": "1"},
+                     {"name": "test_tacac_prov2", "order": "2"}]
+        tacacsplus_provider_group_provider_add_many(handle,
+                                    group_name="test_prov_grp",
+                                    providers=providers)
+    """
+    caller = "tacacsplus_provider_group_provider_add_many"
+    provider_dns = [_provider_dn_get(provider["name"])
+                    for provider in providers]
+    parents = resolve_dns(handle,
+                          [_provider_group_dn_get(group_name)] + provider_dns,
+                          cached=True)
+    tacacsplus_provider_group = tacacsplus_provider_group_get(handle,
+                                                group_name, caller=caller,
+                                                cached=True)
+    missing = [dn for dn in provider_dns if parents[dn] is None]
+    if missing:
+        raise UcsOperationError(caller,
+            "Tacacsplus Providers '%s' do not exist" % ", ".join(missing))
+
+    mos = []
+    for provider in providers:
+        mos.append(_tacacsplus_provider_group_provider_add(
+            handle, tacacsplus_provider_group.dn, **provider))
+
+    handle.commit()
+    return mos
+
+
 def tacacsplus_provider_group_provider_get(handle, group_name, name,
-                            caller="tacacsplus_provider_group_provider_get"):
+                            caller="tacacsplus_provider_group_provider_get",
+                            must_exist=True):
     """
     checks if a tacacsplus provider added to a tacacsplus provider group
 
@@ -344,6 +460,8 @@ def tacacsplus_provider_group_provider_get(handle, group_name, name,
         group_name (string): tacacsplus provider group name
         name (string): tacacsplus provider name
         caller (string): name of the caller function
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         AaaProviderRef: managed object
@@ -356,10 +474,9 @@ def tacacsplus_provider_group_provider_get(handle, group_name, name,
                                     group_name="test_prov_grp",
                                     name="test_tacac_prov")
     """
-    provider_group_dn = _tacacs_dn + "/providergroup-" + group_name
-    provider_ref_dn = provider_group_dn + "/provider-ref-" + name
+    provider_ref_dn = _provider_ref_dn_get(group_name, name)
     mo = handle.query_dn(provider_ref_dn)
-    if mo is None:
+    if mo is None and must_exist:
         raise UcsOperationError(caller,
         "Tacacsplus Provider Reference '%s' does not exist" % provider_ref_dn)
     return mo
@@ -389,10 +506,10 @@ def tacacsplus_provider_group_provider_exists(handle, group_name, name,
                                                   group_name="test_prov_grp",
                                                   name="test_tacac_prov")
     """
-    try:
-        mo = tacacsplus_provider_group_provider_get(handle, group_name, name,
-                        caller="tacacsplus_provider_group_provider_exists")
-    except UcsOperationError:
+    mo = tacacsplus_provider_group_provider_get(handle, group_name, name,
+                    caller="tacacsplus_provider_group_provider_exists",
+                    must_exist=False)
+    if mo is None:
         return (False, None)
 
     if 'order' in kwargs and kwargs['order'] == 'lowest-available':
@@ -402,6 +519,50 @@ def tacacsplus_provider_group_provider_exists(handle, group_name, name,
     return (mo_exists, mo if mo_exists else None)
 
 
+def tacacsplus_provider_group_provider_bulk_exists(handle, group_name, names,
+                                                   **kwargs):
+    """
+    checks if multiple providers exist under a tacacsplus provider group,
+    using a single query
+
+    Args:
+        handle (UcsHandle)
+        group_name (string): tacacsplus provider group name
+        names (list of string): tacacsplus provider names
+        **kwargs: key-value pair of managed object(MO) property and value, Use
+                  'print(ucscoreutils.get_meta_info(<classid>).config_props)'
+                  to get all configurable properties of class
+
+    Returns:
+        dict: provider name to (True/False, AaaProviderRef MO/None)
+
+    Raises:
+        None
+
+    Example:
+        tacacsplus_provider_group_provider_bulk_exists(
+          handle, group_name="test_prov_grp",
+          names=["test_tacacsplus_prov1", "test_tacacsplus_prov2"])
+    """
+    if 'order' in kwargs and kwargs['order'] == 'lowest-available':
+        kwargs.pop('order', None)
+
+    group_dn = _provider_group_dn_get(group_name)
+    refs = dict((mo.name, mo) for mo in
+                handle.query_children(in_dn=group_dn,
+                                      class_id="AaaProviderRef"))
+    match = prop_matcher(AaaProviderRef, **kwargs)
+    result = {}
+    for name in names:
+        mo = refs.get(name)
+        if mo is None:
+            result[name] = (False, None)
+            continue
+        mo_exists = match(mo)
+        result[name] = (mo_exists, mo if mo_exists else None)
+    return result
+
+
 def tacacsplus_provider_group_provider_modify(handle, group_name, name,
                                               **kwargs):
     """
@@ -428,6 +589,8 @@ def tacacsplus_provider_group_provider_modify(handle, group_name, name,
     """
     mo = tacacsplus_provider_group_provider_get(handle, group_name, name,
                         caller="tacacsplus_provider_group_provider_modify")
+    if not props_changed(mo, **kwargs):
+        return mo
     mo.set_prop_multiple(**kwargs)
     handle.set_mo(mo)
     handle.commit()
@@ -459,3 +622,41 @@ def tacacsplus_provider_group_provider_remove(handle, group_name, name):
     handle.remove_mo(mo)
     handle.commit()
 
+
+def tacacsplus_provider_group_provider_remove_many(handle, group_name, names):
+    """
+    removes multiple providers from a tacacsplus provider group in a single
+    commit
+
+    Args:
+        handle (UcsHandle)
+        group_name (string): tacacsplus provider group name
+        names (list of string): tacacsplus provider names
+
+    Returns:
+        None
+
+    Raises:
+        UcsOperationError: if any of the AaaProviderRef is not present, in
+         which case nothing is removed
+
+    Example:
+        tacacsplus_provider_group_provider_remove_many(
+          handle, group_name="test_prov_grp",
+          names=["test_tacacsplus_prov1", "test_tacacsplus_prov2"])
+    """
+    caller = "tacacsplus_provider_group_provider_remove_many"
+    group_dn = _provider_group_dn_get(group_name)
+    refs = dict((mo.name, mo) for mo in
+                handle.query_children(in_dn=group_dn,
+                                      class_id="AaaProviderRef"))
+    missing = [name for name in names if name not in refs]
+    if missing:
+        raise UcsOperationError(caller,
+            "Tacacsplus Provider References '%s' do not exist under '%s'" %
+            (", ".join(missing), group_dn))
+
+    remove_mo = handle.remove_mo
+    for name in names:
+        remove_mo(refs[name])
+    handle.commit()
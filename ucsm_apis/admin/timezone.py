@@ -11,6 +11,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from ucsmsdk.ucsexception import UcsOperationError
+from ucsmsdk.mometa.comm.CommNtpProvider import CommNtpProvider
 
 _base_dn = "sys/svc-ext"
 
@@ -113,8 +114,6 @@ def ntp_server_add(handle, name, descr=None, **kwargs):
     Example:
         ntp_server_add(handle, name="72.163.128.140", descr="Default NTP")
     """
-    from ucsmsdk.mometa.comm.CommNtpProvider import CommNtpProvider
-
     dn = _base_dn + "/datetime-svc"
     mo = CommNtpProvider(parent_mo_or_dn=dn,
                          name=name,
@@ -126,7 +125,7 @@ def ntp_server_add(handle, name, descr=None, **kwargs):
     return mo
 
 
-def ntp_server_get(handle, name, caller="ntp_server_get"):
+def ntp_server_get(handle, name, caller="ntp_server_get", must_exist=True):
     """
     gets ntp server
 
@@ -134,6 +133,8 @@ def ntp_server_get(handle, name, caller="ntp_server_get"):
         handle (UcsHandle)
         name (string): ntp server ip address or hostname
         caller (string): name of the caller function
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         CommNtpProvider: managed object
@@ -144,9 +145,9 @@ def ntp_server_get(handle, name, caller="ntp_server_get"):
     Example:
         ntp_server_get(handle, "72.163.128.140")
     """
-    dn = _base_dn + "/datetime-svc" + "/ntp-" + name
+    dn = "%s/datetime-svc/ntp-%s" % (_base_dn, name)
     mo = handle.query_dn(dn)
-    if mo is None:
+    if mo is None and must_exist:
         raise UcsOperationError(caller, "NTP Server '%s' does not exist" % dn)
     return mo
 
@@ -171,9 +172,8 @@ def ntp_server_exists(handle, name, **kwargs):
     Example:
         ntp_server_exists(handle, "72.163.128.140", descr="Default NTP")
     """
-    try:
-        mo = ntp_server_get(handle, name)
-    except UcsOperationError:
+    mo = ntp_server_get(handle, name, must_exist=False)
+    if mo is None:
         return (False, None)
     mo_exists = mo.check_prop_match(**kwargs)
     return (mo_exists, mo if mo_exists else None)
@@ -15,8 +15,16 @@
 This module performs the operation related to user.
 """
 from ucsmsdk.ucsexception import UcsOperationError
+from ucsmsdk.mometa.aaa.AaaUser import AaaUser
+from ucsmsdk.mometa.aaa.AaaUserLocale import AaaUserLocale
+from ucsmsdk.mometa.aaa.AaaUserRole import AaaUserRole
+from ..utils.utils import prop_matcher, props_changed, props_known, \
+    query_dn_cached, query_dn_cache_clear
 
 _base_dn = "sys/user-ext"
+_user_dn_get = (_base_dn + "/user-{0}").format
+_user_role_dn_get = (_base_dn + "/user-{0}/role-{1}").format
+_user_locale_dn_get = (_base_dn + "/user-{0}/locale-{1}").format
 
 def user_create(handle, name, pwd=None, clear_pwd_history="no",
                 pwd_life_time="no-password-expire", account_status="active",
@@ -24,7 +32,7 @@ def user_create(handle, name, pwd=None, clear_pwd_history="no",
                 enc_pwd_set="no", enc_pwd=None,
                 first_name=None, last_name=None,
                 phone=None, email=None, descr=None,
-                **kwargs):
+                check_exists=False, **kwargs):
     """
     creates user
 
@@ -46,6 +54,9 @@ def user_create(handle, name, pwd=None, clear_pwd_history="no",
         phone (string): phone
         email (string): email
         descr (string): description
+        check_exists (bool): if True, looks the object up first and returns
+         it without committing when it already matches the given properties,
+         skipped when kwargs hold properties unknown to ucsmsdk
         **kwargs: Any additional key-value pair of managed object(MO)'s
                   property and value, which are not part of regular args.
                   This should be used for future version compatibility.
@@ -65,8 +76,44 @@ def user_create(handle, name, pwd=None, clear_pwd_history="no",
                   expiration="2016-01-13T00:00:00", enc_pwd=None,
                   account_status="active")
     """
-    from ucsmsdk.mometa.aaa.AaaUser import AaaUser
+    if check_exists and props_known(AaaUser, kwargs):
+        mo_exists, mo = user_exists(
+            handle, name, pwd=pwd, clear_pwd_history=clear_pwd_history,
+            pwd_life_time=pwd_life_time, account_status=account_status,
+            expires=expires, expiration=expiration, enc_pwd_set=enc_pwd_set,
+            enc_pwd=enc_pwd, first_name=first_name, last_name=last_name,
+            phone=phone, email=email, descr=descr, **kwargs)
+        if mo_exists:
+            return mo
+
+    mo = _user_create(handle, name=name, pwd=pwd,
+                      clear_pwd_history=clear_pwd_history,
+                      pwd_life_time=pwd_life_time,
+                      account_status=account_status,
+                      expires=expires,
+                      expiration=expiration,
+                      enc_pwd_set=enc_pwd_set,
+                      enc_pwd=enc_pwd,
+                      first_name=first_name,
+                      last_name=last_name,
+                      phone=phone,
+                      email=email,
+                      descr=descr,
+                      **kwargs)
+    handle.commit()
+    return mo
+
 
+def _user_create(handle, name, pwd=None, clear_pwd_history="no",
+                 pwd_life_time="no-password-expire", account_status="active",
+                 expires="no", expiration="never",
+                 enc_pwd_set="no", enc_pwd=None,
+                 first_name=None, last_name=None,
+                 phone=None, email=None, descr=None,
+                 **kwargs):
+    """
+    adds single user to the commit buffer without committing it
+    """
     mo = AaaUser(parent_mo_or_dn=_base_dn,
                  name=name,
                  pwd=pwd,
@@ -86,17 +133,123 @@ def user_create(handle, name, pwd=None, clear_pwd_history="no",
 
     mo.set_prop_multiple(**kwargs)
     handle.add_mo(mo, modify_present=True)
-    handle.commit()
     return mo
 
 
-def user_get(handle, name, caller="user_get"):
+class UserSpec(object):
+    """
+    compact description of a user, for the bulk create functions
+
+    Holds the arguments of user_create in slots instead of a dict, which
+    keeps long lists of users small. Properties that are not part of the
+    regular args are passed as keyword arguments and kept in kwargs.
+
+    Example:
+        users = [UserSpec("test%d" % i, pwd="p@ssw0rd") for i in range(500)]
+        user_create_many(handle, users)
+    """
+    __slots__ = ("name", "pwd", "clear_pwd_history", "pwd_life_time",
+                 "account_status", "expires", "expiration", "enc_pwd_set",
+                 "enc_pwd", "first_name", "last_name", "phone", "email",
+                 "descr", "kwargs")
+
+    def __init__(self, name, pwd=None, clear_pwd_history="no",
+                 pwd_life_time="no-password-expire", account_status="active",
+                 expires="no", expiration="never",
+                 enc_pwd_set="no", enc_pwd=None,
+                 first_name=None, last_name=None,
+                 phone=None, email=None, descr=None,
+                 **kwargs):
+        self.name = name
+        self.pwd = pwd
+        self.clear_pwd_history = clear_pwd_history
+        self.pwd_life_time = pwd_life_time
+        self.account_status = account_status
+        self.expires = expires
+        self.expiration = expiration
+        self.enc_pwd_set = enc_pwd_set
+        self.enc_pwd = enc_pwd
+        self.first_name = first_name
+        self.last_name = last_name
+        self.phone = phone
+        self.email = email
+        self.descr = descr
+        self.kwargs = kwargs or None
+
+    def props(self):
+        """
+        returns the spec as user_create keyword arguments
+        """
+        props = dict((slot, getattr(self, slot))
+                     for slot in self.__slots__[:-1])
+        if self.kwargs:
+            props.update(self.kwargs)
+        return props
+
+
+def _user_create_from(handle, user):
+    if isinstance(user, UserSpec):
+        return _user_create(handle, **user.props())
+    return _user_create(handle, **user)
+
+
+def user_create_many(handle, users, batch_size=20):
+    """
+    creates multiple users, committing them in batches
+
+    Args:
+        handle (UcsHandle)
+        users (list of dict or UserSpec): each dict holds the arguments of
+         user_create, "name" is mandatory
+        batch_size (int): number of users sent to UCSM per commit
+
+    Returns:
+        list of AaaUser: managed objects
+
+    Raises:
+        UcsOperationError: if batch_size is less than 1
+
+    Note:
+        Each batch is committed on its own. If a later batch fails, the
+        users of the earlier batches stay created on UCSM, and the users
+        staged for the failed batch are discarded.
+
+    Example:
+        users = [{"name": "test1", "pwd": "p@ssw0rd"},
+                 {"name": "test2", "pwd": "p@ssw0rd", "expires": "no"}]
+        user_create_many(handle, users)
+    """
+    if batch_size < 1:
+        raise UcsOperationError("user_create_many",
+                                "batch_size must be at least 1, got %s" %
+                                batch_size)
+
+    mos = []
+    try:
+        for user in users:
+            mos.append(_user_create_from(handle, user))
+            if len(mos) % batch_size == 0:
+                handle.commit()
+
+        if len(mos) % batch_size:
+            handle.commit()
+    except Exception:
+        handle.commit_buffer_discard()
+        raise
+    return mos
+
+
+def user_get(handle, name, caller="user_get", cached=False, must_exist=True):
     """
     gets user
 
     Args:
         handle (UcsHandle)
         name (string): user name
+        cached (bool): reuse a recent lookup of the same object on this
+         handle, meant for parent lookups
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         AaaUser: managed object
@@ -107,9 +260,12 @@ def user_get(handle, name, caller="user_get"):
     Example:
         user_get(handle, name="test")
     """
-    dn = _base_dn + "/user-" + name
-    mo = handle.query_dn(dn)
-    if mo is None:
+    dn = _user_dn_get(name)
+    if cached:
+        mo = query_dn_cached(handle, dn)
+    else:
+        mo = handle.query_dn(dn)
+    if mo is None and must_exist:
         raise UcsOperationError(caller, "User '%s' does not exist" % dn)
     return mo
 
@@ -140,14 +296,48 @@ def user_exists(handle, name, **kwargs):
                   expiration="2016-01-13T00:00:00", enc_pwd=None,
                   account_status="active")
     """
-    try:
-        mo = user_get(handle, name, caller="user_exists")
-    except UcsOperationError:
+    mo = user_get(handle, name, caller="user_exists", must_exist=False)
+    if mo is None:
         return (False, None)
     mo_exists = mo.check_prop_match(**kwargs)
     return (mo_exists, mo if mo_exists else None)
 
 
+def user_bulk_exists(handle, names, **kwargs):
+    """
+    checks if multiple users exist, using a single query
+
+    Args:
+        handle (UcsHandle)
+        names (list of string): user names
+        **kwargs: key-value pair of managed object(MO) property and value, Use
+                  'print(ucscoreutils.get_meta_info(<classid>).config_props)'
+                  to get all configurable properties of class
+
+    Returns:
+        dict: user name to (True/False, AaaUser MO/None)
+
+    Raises:
+        None
+
+    Example:
+        user_bulk_exists(handle, names=["test1", "test2"],
+                         account_status="active")
+    """
+    users = dict((mo.name, mo) for mo in
+                 handle.query_children(in_dn=_base_dn, class_id="AaaUser"))
+    match = prop_matcher(AaaUser, **kwargs)
+    result = {}
+    for name in names:
+        mo = users.get(name)
+        if mo is None:
+            result[name] = (False, None)
+            continue
+        mo_exists = match(mo)
+        result[name] = (mo_exists, mo if mo_exists else None)
+    return result
+
+
 def user_modify(handle, name, **kwargs):
     """
     modifies user
@@ -175,6 +365,8 @@ def user_modify(handle, name, **kwargs):
                   account_status="active")
     """
     mo = user_get(handle, name, "user_modify")
+    if not props_changed(mo, **kwargs):
+        return mo
     mo.set_prop_multiple(**kwargs)
     handle.set_mo(mo)
     handle.commit()
@@ -202,14 +394,47 @@ def user_delete(handle, name):
     mo = user_get(handle, name, "user_delete")
     handle.remove_mo(mo)
     handle.commit()
+    query_dn_cache_clear(handle, mo.dn)
+
 
-def _user_role_add(handle, user_mo, name, descr=None, **kwargs):
+def user_delete_many(handle, names):
+    """
+    deletes multiple users in a single commit
+
+    Args:
+        handle (UcsHandle)
+        names (list of string): user names
+
+    Returns:
+        None
+
+    Raises:
+        UcsOperationError: if any of the AaaUser is not present, in which
+         case nothing is deleted
+
+    Example:
+        user_delete_many(handle, names=["test1", "test2"])
+    """
+    users = dict((mo.name, mo) for mo in
+                 handle.query_children(in_dn=_base_dn, class_id="AaaUser"))
+    missing = [name for name in names if name not in users]
+    if missing:
+        raise UcsOperationError("user_delete_many",
+                                "Users '%s' do not exist" % ", ".join(missing))
+
+    remove_mo = handle.remove_mo
+    for name in names:
+        remove_mo(users[name])
+    handle.commit()
+    for name in names:
+        query_dn_cache_clear(handle, users[name].dn)
+
+
+def _user_role_add(handle, user_dn, name, descr=None, **kwargs):
     """
     adds single role to an user
     """
-    from ucsmsdk.mometa.aaa.AaaUserRole import AaaUserRole
-
-    mo = AaaUserRole(parent_mo_or_dn=user_mo, name=name, descr=descr)
+    mo = AaaUserRole(parent_mo_or_dn=user_dn, name=name, descr=descr)
     mo.set_prop_multiple(**kwargs)
     handle.add_mo(mo, modify_present=True)
     return mo
@@ -236,14 +461,12 @@ def user_role_add(handle, user_name, name, descr=None, **kwargs):
     Example:
         user_role_add(handle, user_name="test", name="admin")
     """
-    from ucsmsdk.mometa.aaa.AaaUserRole import AaaUserRole
-
-    user = user_get(handle, user_name, "user_role_add")
+    user = user_get(handle, user_name, "user_role_add", cached=True)
 
     roles = [role.strip() for role in name.split(',')]
     roles_mo = []
     for role in roles:
-        role_mo = _user_role_add(handle, user_mo=user, name=role,
+        role_mo = _user_role_add(handle, user_dn=user.dn, name=role,
                                  descr=descr, **kwargs)
         roles_mo.append(role_mo)
 
@@ -251,7 +474,8 @@ def user_role_add(handle, user_name, name, descr=None, **kwargs):
     return roles_mo
 
 
-def user_role_get(handle, user_name, name, caller="user_role_get"):
+def user_role_get(handle, user_name, name, caller="user_role_get",
+                  must_exist=True):
     """
     gets role of the user
 
@@ -259,6 +483,8 @@ def user_role_get(handle, user_name, name, caller="user_role_get"):
         handle (UcsHandle)
         user_name (string): username
         name (string): rolename
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         AaaUserRole: managed object
@@ -269,18 +495,17 @@ def user_role_get(handle, user_name, name, caller="user_role_get"):
     Example:
         user_role_get(handle, user_name="test", name="admin")
     """
-    user_dn = _base_dn + "/user-" + user_name
-    dn = user_dn + "/role-" + name
+    dn = _user_role_dn_get(user_name, name)
     mo = handle.query_dn(dn)
-    if mo is None:
+    if mo is None and must_exist:
         raise UcsOperationError(caller, "User role '%s' does not exist" % dn)
     return mo
 
 
 def _user_role_exists(handle, user_name, name, **kwargs):
-    try:
-        mo = user_role_get(handle, user_name, name, "user_role_exists")
-    except UcsOperationError:
+    mo = user_role_get(handle, user_name, name, "user_role_exists",
+                       must_exist=False)
+    if mo is None:
         return (False, None)
     mo_exists = mo.check_prop_match(**kwargs)
     return (mo_exists, mo if mo_exists else None)
@@ -340,6 +565,8 @@ def user_role_modify(handle, user_name, name, **kwargs):
         user_role_modify(handle, user_name="test", name="admin")
     """
     mo = user_role_get(handle, user_name, name, "user_role_modify")
+    if not props_changed(mo, **kwargs):
+        return mo
     mo.set_prop_multiple(**kwargs)
     handle.set_mo(mo)
     handle.commit()
@@ -365,9 +592,10 @@ def user_role_remove(handle, user_name, name):
         user_role_remove(handle, user_name="test", name="admin")
     """
     roles = [role.strip() for role in name.split(',')]
+    remove_mo = handle.remove_mo
     for role in roles:
         mo = user_role_get(handle, user_name, role, "user_role_remove")
-        handle.remove_mo(mo)
+        remove_mo(mo)
     handle.commit()
 
 
@@ -392,18 +620,18 @@ def user_locale_add(handle, user_name, name, descr=None, **kwargs):
     Example:
         user_locale_add(handle, user_name="test", name="testlocale")
     """
-    from ucsmsdk.mometa.aaa.AaaUserLocale import AaaUserLocale
-
-    user = user_get(handle, user_name, caller="user_locale_add")
+    user = user_get(handle, user_name, caller="user_locale_add",
+                    cached=True)
 
-    mo = AaaUserLocale(parent_mo_or_dn=user, name=name, descr=descr)
+    mo = AaaUserLocale(parent_mo_or_dn=user.dn, name=name, descr=descr)
     mo.set_prop_multiple(**kwargs)
     handle.add_mo(mo, modify_present=True)
     handle.commit()
     return mo
 
 
-def user_locale_get(handle, user_name, name, caller="user_locale_get"):
+def user_locale_get(handle, user_name, name, caller="user_locale_get",
+                    must_exist=True):
     """
     gets locale for the user
 
@@ -411,6 +639,8 @@ def user_locale_get(handle, user_name, name, caller="user_locale_get"):
         handle (UcsHandle)
         user_name (string): username
         name (string): locale name
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         AaaUserLocale: managed object
@@ -421,10 +651,9 @@ def user_locale_get(handle, user_name, name, caller="user_locale_get"):
     Example:
         user_locale_get(handle, user_name="test", name="testlocale")
     """
-    user_dn = _base_dn + "/user-" + user_name
-    dn = user_dn + "/locale-" + name
+    dn = _user_locale_dn_get(user_name, name)
     mo = handle.query_dn(dn)
-    if mo is None:
+    if mo is None and must_exist:
         raise UcsOperationError(caller, "User locale '%s' does not exist" % dn)
     return mo
 
@@ -450,10 +679,9 @@ def user_locale_exists(handle, user_name, name, **kwargs):
     Example:
         user_locale_exists(handle, user_name="test", name="testlocale")
     """
-    try:
-        mo = user_locale_get(handle, user_name, name,
-                             caller="user_locale_exists")
-    except UcsOperationError:
+    mo = user_locale_get(handle, user_name, name,
+                         caller="user_locale_exists", must_exist=False)
+    if mo is None:
         return (False, None)
     mo_exists = mo.check_prop_match(**kwargs)
     return (mo_exists, mo if mo_exists else None)
@@ -481,9 +709,12 @@ def user_locale_modify(handle, user_name, name, **kwargs):
         user_locale_modify(handle, user_name="test", name="testlocale")
     """
     mo = user_locale_get(handle, user_name, name, caller="user_locale_modify")
+    if not props_changed(mo, **kwargs):
+        return mo
     mo.set_prop_multiple(**kwargs)
     handle.set_mo(mo)
     handle.commit()
+    return mo
 
 
 def user_locale_remove(handle, user_name, name):
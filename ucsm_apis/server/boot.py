@@ -16,6 +16,29 @@ This module performs the operation related to boot.
 from ucsmsdk import ucsgenutils
 from ucsmsdk.ucsexception import UcsOperationError
 from ucsmsdk.ucscoreutils import load_class
+from ucsmsdk.mometa.lsboot.LsbootBootSecurity import LsbootBootSecurity
+from ucsmsdk.mometa.lsboot.LsbootEmbeddedLocalDiskImage import \
+    LsbootEmbeddedLocalDiskImage
+from ucsmsdk.mometa.lsboot.LsbootEmbeddedLocalDiskImagePath import \
+    LsbootEmbeddedLocalDiskImagePath
+from ucsmsdk.mometa.lsboot.LsbootIScsi import LsbootIScsi
+from ucsmsdk.mometa.lsboot.LsbootIScsiImagePath import LsbootIScsiImagePath
+from ucsmsdk.mometa.lsboot.LsbootLan import LsbootLan
+from ucsmsdk.mometa.lsboot.LsbootLanImagePath import LsbootLanImagePath
+from ucsmsdk.mometa.lsboot.LsbootLocalDiskImage import LsbootLocalDiskImage
+from ucsmsdk.mometa.lsboot.LsbootLocalDiskImagePath import \
+    LsbootLocalDiskImagePath
+from ucsmsdk.mometa.lsboot.LsbootLocalHddImage import LsbootLocalHddImage
+from ucsmsdk.mometa.lsboot.LsbootLocalLunImagePath import \
+    LsbootLocalLunImagePath
+from ucsmsdk.mometa.lsboot.LsbootLocalStorage import LsbootLocalStorage
+from ucsmsdk.mometa.lsboot.LsbootPolicy import LsbootPolicy
+from ucsmsdk.mometa.lsboot.LsbootSan import LsbootSan
+from ucsmsdk.mometa.lsboot.LsbootSanCatSanImage import LsbootSanCatSanImage
+from ucsmsdk.mometa.lsboot.LsbootSanCatSanImagePath import \
+    LsbootSanCatSanImagePath
+from ucsmsdk.mometa.lsboot.LsbootStorage import LsbootStorage
+from ..utils.utils import props_changed
 
 def boot_policy_create(handle, name, org_dn="org-root",
                        reboot_on_update="no", enforce_vnic_name="yes",
@@ -52,8 +75,6 @@ def boot_policy_create(handle, name, org_dn="org-root",
                            boot_mode="legacy",
                            descr="sample description")
     """
-    from ucsmsdk.mometa.lsboot.LsbootPolicy import LsbootPolicy
-
     obj = handle.query_dn(org_dn)
     if not obj:
         raise UcsOperationError("boot_policy_create", "Org '%s' does not \
@@ -72,7 +93,8 @@ def boot_policy_create(handle, name, org_dn="org-root",
     return mo
 
 
-def boot_policy_get(handle, name, org_dn="org-root", caller="boot_policy_get"):
+def boot_policy_get(handle, name, org_dn="org-root", caller="boot_policy_get",
+                    must_exist=True):
     """
     gets boot policy.
 
@@ -81,6 +103,8 @@ def boot_policy_get(handle, name, org_dn="org-root", caller="boot_policy_get"):
         name (string): boot policy name
         org_dn (string): org dn
         caller (string): caller method name
+        must_exist (bool): if False, returns None instead of raising
+         when the object is not present
 
     Returns:
         LsbootPolicy: managed object
@@ -94,9 +118,9 @@ _       boot_policy_get(handle,
                         org_dn="org-root/org-finance",
                         caller="boot_policy_modify")
     """
-    dn = org_dn + "/boot-policy-" + name
+    dn = "%s/boot-policy-%s" % (org_dn, name)
     mo = handle.query_dn(dn)
-    if mo is None:
+    if mo is None and must_exist:
         raise UcsOperationError(caller, "BootPolicy '%s' does not exist" % dn)
     return mo
 
@@ -123,10 +147,9 @@ def boot_policy_exists(handle, name, org_dn="org-root", **kwargs):
         boot_policy_exists(handle, name="sample_boot",
                           org_dn="org-root/org-finance")
     """
-    try:
-        mo = boot_policy_get(handle=handle, name=name, org_dn=org_dn,
-                             caller="boot_policy_exists")
-    except UcsOperationError:
+    mo = boot_policy_get(handle=handle, name=name, org_dn=org_dn,
+                         caller="boot_policy_exists", must_exist=False)
+    if mo is None:
         return (False, None)
     mo_exists = mo.check_prop_match(**kwargs)
     return (mo_exists, mo if mo_exists else None)
@@ -158,6 +181,8 @@ def boot_policy_modify(handle, name, org_dn="org-root", **kwargs):
     """
     mo = boot_policy_get(handle=handle, name=name, org_dn=org_dn,
                          caller="boot_policy_modify")
+    if not props_changed(mo, **kwargs):
+        return mo
     mo.set_prop_multiple(**kwargs)
     handle.set_mo(mo)
     handle.commit()
@@ -190,8 +215,6 @@ def boot_policy_delete(handle, name, org_dn="org-root"):
 
 
 def _boot_security_configure(handle, name, org_dn, secure_boot, **kwargs):
-    from ucsmsdk.mometa.lsboot.LsbootBootSecurity import LsbootBootSecurity
-
     boot_policy = boot_policy_get(handle, name, org_dn,
                                   caller="boot_security_enable")
     if boot_policy.boot_mode != "uefi":
@@ -257,7 +280,7 @@ def boot_security_exists(handle, name, org_dn="org-root", **kwargs):
         boot_security_exists(handle, name="sample_boot",
                           org_dn="org-root/org-finance")
     """
-    dn = org_dn + "/boot-policy-" + name + "/boot-security"
+    dn = "%s/boot-policy-%s/boot-security" % (org_dn, name)
     mo = handle.query_dn(dn)
     if mo is None:
         return False, None
@@ -291,10 +314,6 @@ def boot_security_disable(handle, name, org_dn="org-root"):
 
 
 def _local_lun_add(parent_mo, order, lun_name=None, type=None):
-    from ucsmsdk.mometa.lsboot.LsbootLocalHddImage import LsbootLocalHddImage
-    from ucsmsdk.mometa.lsboot.LsbootLocalLunImagePath import \
-        LsbootLocalLunImagePath
-
     mo = [mo for mo in parent_mo.child
           if mo.get_class_id() == "LsbootLocalHddImage"]
     if mo and not mo[0].child:
@@ -336,11 +355,6 @@ def _local_lun_add(parent_mo, order, lun_name=None, type=None):
 
 
 def _local_jbod_add(parent_mo, order, slot_number):
-    from ucsmsdk.mometa.lsboot.LsbootLocalDiskImage import \
-        LsbootLocalDiskImage
-    from ucsmsdk.mometa.lsboot.LsbootLocalDiskImagePath import \
-        LsbootLocalDiskImagePath
-
     mo = [mo for mo in parent_mo.child
           if mo.get_class_id() == "LsbootLocalDiskImage"]
     if mo:
@@ -361,11 +375,6 @@ def _local_jbod_add(parent_mo, order, slot_number):
 
 
 def _local_embedded_disk_add(parent_mo, order, slot_number=None, type=None):
-    from ucsmsdk.mometa.lsboot.LsbootEmbeddedLocalDiskImage import \
-        LsbootEmbeddedLocalDiskImage
-    from ucsmsdk.mometa.lsboot.LsbootEmbeddedLocalDiskImagePath import \
-        LsbootEmbeddedLocalDiskImagePath
-
     mo = [mo for mo in parent_mo.child
           if mo.get_class_id() == "LsbootEmbeddedLocalDiskImage"]
     if mo and not mo[0].child:
@@ -407,9 +416,6 @@ def _local_embedded_disk_add(parent_mo, order, slot_number=None, type=None):
 
 
 def _lan_device_add(parent_mo, order, vnic_name):
-    from ucsmsdk.mometa.lsboot.LsbootLan import LsbootLan
-    from ucsmsdk.mometa.lsboot.LsbootLanImagePath import LsbootLanImagePath
-
     mo = [mo for mo in parent_mo.child
           if mo.get_class_id() == "LsbootLan"]
 
@@ -445,13 +451,10 @@ def _children_get(parent_mo, class_id):
 
 
 def _san_add(parent_mo, order):
-    from ucsmsdk.mometa.lsboot.LsbootSan import LsbootSan
     return LsbootSan(parent_mo_or_dn=parent_mo, order=order)
 
 
 def _san_image_add(parent_mo, type, vnic_name):
-    from ucsmsdk.mometa.lsboot.LsbootSanCatSanImage import \
-        LsbootSanCatSanImage
     if not (vnic_name and type):
         raise UcsOperationError("Required Parameter 'vnic_name' or "
                                 "'type' missing.")
@@ -461,8 +464,6 @@ def _san_image_add(parent_mo, type, vnic_name):
 
 
 def _san_boot_target_add(parent_mo, target_type, wwn, lun):
-    from ucsmsdk.mometa.lsboot.LsbootSanCatSanImagePath import \
-        LsbootSanCatSanImagePath
     if target_type or wwn or lun:
         if not (wwn and lun and target_type):
             raise UcsOperationError("Required Parameter 'wwn' or "
@@ -608,9 +609,6 @@ def _san_device_add(parent_mo, order,
 
 
 def _iscsi_device_add(parent_mo, order, vnic_name):
-    from ucsmsdk.mometa.lsboot.LsbootIScsi import LsbootIScsi
-    from ucsmsdk.mometa.lsboot.LsbootIScsiImagePath import LsbootIScsiImagePath
-
     mo = [mo for mo in parent_mo.child
           if mo.get_class_id() == "LsbootIScsi"]
 
@@ -686,8 +684,8 @@ def _local_device_add(parent_mo, device_name, device_order, **kwargs):
             (device_name, mo[0].order))
 
     class_struct = load_class(class_id)
-    class_obj = class_struct(parent_mo_or_dn=parent_mo, order=device_order,
-                             **kwargs)
+    class_struct(parent_mo_or_dn=parent_mo, order=device_order,
+                 **kwargs)
 
 
 def _vmedia_device_add(parent_mo, device_name, device_order, **kwargs):
@@ -702,9 +700,9 @@ def _vmedia_device_add(parent_mo, device_name, device_order, **kwargs):
             (device_name, mo[0].order))
 
     class_struct = load_class(class_id)
-    class_obj = class_struct(parent_mo_or_dn=parent_mo,
-                             access=access,
-                             order=device_order, **kwargs)
+    class_struct(parent_mo_or_dn=parent_mo,
+                 access=access,
+                 order=device_order, **kwargs)
 
 
 def _efi_device_add(parent_mo, device_order, **kwargs):
@@ -713,12 +711,24 @@ def _efi_device_add(parent_mo, device_order, **kwargs):
     mo = [mo for mo in parent_mo.child if mo.get_class_id() == class_id]
     if mo:
         raise UcsOperationError(
-        "__efi_device_add", "Device '%s' already exist at order '%s'" %
-        (device_name, mo[0].order))
+        "_efi_device_add", "Device '%s' already exist at order '%s'" %
+        ("efi", mo[0].order))
 
     class_struct = load_class(class_id)
-    class_obj = class_struct(parent_mo_or_dn=parent_mo,
-                             order=device_order, **kwargs)
+    class_struct(parent_mo_or_dn=parent_mo,
+                 order=device_order, **kwargs)
+
+
+_cd_dvd_split_devices = frozenset(["cd_dvd_local", "cd_dvd_remote"])
+_floppy_split_devices = frozenset(["floppy_local", "floppy_remote"])
+_device_keys = frozenset(["device_name", "device_order"])
+
+_device_add_methods = {
+    "lan": _lan_device_add,
+    "san": _san_device_add,
+    "iscsi": _iscsi_device_add,
+    "efi": _efi_device_add,
+}
 
 
 def _validate_device_combination(devices):
@@ -740,11 +750,11 @@ def _validate_device_combination(devices):
             local_inner_level = True
         elif device_name == "cd_dvd":
             cd_dvd = True
-        elif device_name in ["cd_dvd_local", "cd_dvd_remote"]:
+        elif device_name in _cd_dvd_split_devices:
             cd_dvd_rest = True
         elif device_name == "floppy":
             floppy = True
-        elif device_name in ["floppy_local", "floppy_remote"]:
+        elif device_name in _floppy_split_devices:
             floppy_rest = True
 
     if local_outer_level and local_inner_level:
@@ -760,17 +770,14 @@ def _validate_device_combination(devices):
 
 
 def _device_add(handle, boot_policy, devices):
-    from ucsmsdk.mometa.lsboot.LsbootStorage import LsbootStorage
-    from ucsmsdk.mometa.lsboot.LsbootLocalStorage import LsbootLocalStorage
-
     _validate_device_combination(devices)
 
     ls_boot_storage_exist = False
     for device in devices:
         device_name = device["device_name"]
         device_order = str(device["device_order"])
-        device_props = {key: value for key, value in device.iteritems()
-                        if key not in ["device_name", "device_order"]}
+        device_props = {key: value for key, value in device.items()
+                        if key not in _device_keys}
         if device_name in _local_devices:
             if not ls_boot_storage_exist:
                 lsboot_storage = LsbootStorage(parent_mo_or_dn=boot_policy)
@@ -781,19 +788,15 @@ def _device_add(handle, boot_policy, devices):
                               device_order, **device_props)
         elif device_name in _vmedia_devices:
             _vmedia_device_add(boot_policy, device_name, device_order)
-        elif device_name == "lan":
-            _lan_device_add(boot_policy, device_order, **device_props)
-        elif device_name == "san":
-            _san_device_add(boot_policy, device_order, **device_props)
-        elif device_name == "iscsi":
-            _iscsi_device_add(boot_policy, device_order, **device_props)
-        elif device_name == "efi":
-            _efi_device_add(boot_policy, device_order, **device_props)
         else:
-            raise UcsOpeartionError(
-                "_device_add",
-                " Invalid Device <%s>" %
-                device_name)
+            try:
+                device_add = _device_add_methods[device_name]
+            except KeyError:
+                raise UcsOperationError(
+                    "_device_add",
+                    " Invalid Device <%s>" %
+                    device_name)
+            device_add(boot_policy, device_order, **device_props)
 
 
 def _boot_policy_order_clear(handle, boot_policy):
@@ -801,10 +804,11 @@ def _boot_policy_order_clear(handle, boot_policy):
     mo_list = handle.query_children(in_mo=boot_policy)
     if mo_list is None:
         return
+    remove_mo = handle.remove_mo
     for mo in mo_list:
         if mo.get_class_id() == "LsbootBootSecurity":
             continue
-        handle.remove_mo(mo)
+        remove_mo(mo)
 
     if boot_policy.reboot_on_update in ucsgenutils.AFFIRMATIVE_LIST:
         boot_policy.reboot_on_update = "no"
@@ -841,7 +845,7 @@ def _extract_device_from_bp_child(bp_child):
         elif class_id == "LsbootEFIShell":
             bp_devices["efi"] = ch_
         else:
-            raise UcsOpeationError("_compare_boot_policy", "Unknown Device.")
+            raise UcsOperationError("_compare_boot_policy", "Unknown Device.")
 
     return bp_devices
 
@@ -962,8 +966,8 @@ def _compare_lan(existing_lan, expected_lan):
     if len(existing_child) == 1:
         _device_compare(existing_child[0],
                         'lan',
-                        type=expected_lan.type,
-                        vnic_name=expected_lan.vnic_name)
+                        type=expected_child[0].type,
+                        vnic_name=expected_child[0].vnic_name)
     if len(existing_child) == 2:
         existing_child_primary, existing_child_secondary =\
             _child_pri_sec_filter(existing_child)
@@ -992,9 +996,9 @@ def _compare_san_sub_child(existing_sub_child, expected_sub_child):
     if len(existing_sub_child) == 1:
         _device_compare(existing_sub_child[0],
                         'san',
-                        type=expected_san.type,
-                        wwn=expected_sub_child.wwn,
-                        lun=expected_sub_child.lun)
+                        type=expected_sub_child[0].type,
+                        wwn=expected_sub_child[0].wwn,
+                        lun=expected_sub_child[0].lun)
     if len(existing_sub_child) == 2:
         existing_sub_child_primary, existing_sub_child_secondary =\
             _child_pri_sec_filter(existing_sub_child)
@@ -1030,11 +1034,11 @@ def _compare_san(existing_san, expected_san):
     if len(existing_child) == 1:
         _device_compare(existing_child[0],
                         'san',
-                        type=expected_san.type,
-                        vnic_name=expected_san.vnic_name)
+                        type=expected_child[0].type,
+                        vnic_name=expected_child[0].vnic_name)
 
-        existing_sub_child = existing_child.child
-        expected_sub_child = expected_child.child
+        existing_sub_child = existing_child[0].child
+        expected_sub_child = expected_child[0].child
 
         _compare_san_sub_child(existing_sub_child, expected_sub_child)
 
@@ -1103,6 +1107,14 @@ def _compare_efi(existing_efi, expected_efi):
     _device_compare(existing_efi, 'efi', order=expected_efi.order)
 
 
+_device_compare_methods = {
+    "lan": _compare_lan,
+    "san": _compare_san,
+    "iscsi": _compare_iscsi,
+    "efi": _compare_efi,
+}
+
+
 def _compare_boot_policy(existing_boot_policy, expected_boot_policy):
     # check child count
     existing_bp_child = existing_boot_policy.child
@@ -1150,18 +1162,9 @@ def _compare_boot_policy(existing_boot_policy, expected_boot_policy):
             elif device_name == "embedded_disk":
                 _compare_embedded_disk(existing_bp_device,
                                        expected_bp_device)
-        elif device_name == "lan":
-            _compare_lan(existing_bp_device,
-                         expected_bp_device)
-        elif device_name == "san":
-            _compare_san(existing_bp_device,
-                         expected_bp_device)
-        elif device_name == "iscsi":
-            _compare_iscsi(existing_bp_device,
-                           expected_bp_device)
-        elif device_name == "efi":
-            _compare_efi(existing_bp_device,
-                         expected_bp_device)
+        elif device_name in _device_compare_methods:
+            _device_compare_methods[device_name](existing_bp_device,
+                                                 expected_bp_device)
 
 
 def boot_policy_order_set(handle, name, devices, org_dn="org-root"):
@@ -1401,7 +1404,7 @@ def boot_policy_order_exists(handle, name, devices, org_dn="org-root",
 
         # Add devices and configure boot order
         _device_add(handle, boot_policy, devices)
-    except Exception as err:
+    except Exception:
         return False, None
 
     expected_boot_policy = boot_policy
@@ -1411,15 +1414,15 @@ def boot_policy_order_exists(handle, name, devices, org_dn="org-root",
                                    hierarchy=True,
                                    need_response=True)
         existing_boot_policy = response.out_configs.child[0]
-    except Exception as err:
+    except Exception:
         if debug:
             import traceback
-            print str(traceback.print_exc())
+            print(str(traceback.print_exc()))
         return False, None
 
     try:
         _compare_boot_policy(existing_boot_policy, expected_boot_policy)
-    except Exception as err:
+    except Exception:
         return False, None
 
     return True, boot_policy
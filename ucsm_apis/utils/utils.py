@@ -11,10 +11,263 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
+import weakref
+from contextlib import contextmanager
+
+# per handle cache of {dn: (mo, expiry)} for parent lookups
+_query_dn_cache = weakref.WeakKeyDictionary()
+
 
 def blade_dn_get(chassis_id, blade_id):
-    return "sys/chassis-" + str(chassis_id) + '/blade-' + str(blade_id)
+    return "sys/chassis-%s/blade-%s" % (chassis_id, blade_id)
 
 
 def rack_dn_get(rack_id):
-    return "sys/rack-unit-" + str(rack_id)
+    return "sys/rack-unit-%s" % rack_id
+
+
+def query_dn_cached(handle, dn, ttl=30):
+    """
+    Queries a dn, reusing the result of an earlier query on the same handle
+    for ttl seconds. Meant for parent lookups which are otherwise repeated
+    for every child managed object added under the same parent.
+    Missing objects are not cached.
+
+    Args:
+        handle (UcsHandle)
+        dn (string): dn of the managed object
+        ttl (int): number of seconds the cached result stays valid
+
+    Returns:
+        Managed object OR None
+
+    Example:
+        mo = query_dn_cached(handle, "sys/radius-ext/providergroup-test")
+    """
+    handle = getattr(handle, "_batched_handle", handle)
+    cache = _query_dn_cache.setdefault(handle, {})
+    now = time.time()
+    entry = cache.get(dn)
+    if entry is not None and entry[1] > now:
+        return entry[0]
+
+    mo = handle.query_dn(dn)
+    if mo is None:
+        cache.pop(dn, None)
+    else:
+        cache[dn] = (mo, now + ttl)
+    return mo
+
+
+def resolve_dns(handle, dns, cached=False, ttl=30):
+    """
+    Queries several dns in a single request.
+
+    With cached=True, results cached by query_dn_cached on the same handle
+    are reused, and the objects fetched are added to that cache, so that
+    later cached lookups of any of the dns do not go to the server again.
+    Only use it for parent lookups whose callers clear the cache when the
+    parent is deleted.
+
+    Args:
+        handle (UcsHandle)
+        dns (list of string): dns of the managed objects
+        cached (bool): read from and fill the per handle lookup cache
+        ttl (int): number of seconds the cached results stay valid
+
+    Returns:
+        dict: dn to managed object, or None if it is not present
+
+    Example:
+        mos = resolve_dns(handle, ["sys/radius-ext/provider-test",
+                                   "sys/radius-ext/providergroup-test"])
+    """
+    if not cached:
+        mos = handle.query_dns(list(dns))
+        return dict((dn, mos.get(dn)) for dn in dns)
+
+    cache = _query_dn_cache.setdefault(
+        getattr(handle, "_batched_handle", handle), {})
+    now = time.time()
+    result = {}
+    missing = []
+    for dn in dns:
+        entry = cache.get(dn)
+        if entry is not None and entry[1] > now:
+            result[dn] = entry[0]
+        else:
+            missing.append(dn)
+
+    if missing:
+        mos = handle.query_dns(missing)
+        for dn in missing:
+            mo = mos.get(dn)
+            result[dn] = mo
+            if mo is None:
+                cache.pop(dn, None)
+            else:
+                cache[dn] = (mo, now + ttl)
+    return result
+
+
+def query_dn_cache_clear(handle, dn):
+    """
+    Drops the cached result for dn and for everything cached below it
+
+    Args:
+        handle (UcsHandle)
+        dn (string): dn of the managed object
+
+    Returns:
+        None
+
+    Example:
+        query_dn_cache_clear(handle, "sys/radius-ext/providergroup-test")
+    """
+    handle = getattr(handle, "_batched_handle", handle)
+    cache = _query_dn_cache.get(handle)
+    if not cache:
+        return
+
+    prefix = dn + "/"
+    for cached_dn in [key for key in cache
+                      if key == dn or key.startswith(prefix)]:
+        del cache[cached_dn]
+
+
+def props_changed(mo, **kwargs):
+    """
+    Checks if setting kwargs on mo would change any of its properties.
+    Unlike mo.check_prop_match, a None value is compared like any other.
+
+    Args:
+        mo (ManagedObject): managed object
+        **kwargs: key-value pair of managed object(MO) property and value
+
+    Returns:
+        True/False
+
+    Example:
+        if props_changed(mo, descr="new description"):
+            ...
+    """
+    for prop_name, value in kwargs.items():
+        if getattr(mo, prop_name, None) != value:
+            return True
+    return False
+
+
+def props_known(mo_class, props):
+    """
+    Checks if every key of props is a property known to mo_class. Unknown
+    properties are force-set by ucsmsdk on create but cannot be compared
+    by mo.check_prop_match, which raises ValueError for them.
+
+    Args:
+        mo_class (class): managed object class, e.g. AaaUser
+        props (dict): managed object(MO) property and value
+
+    Returns:
+        True/False
+
+    Example:
+        props_known(AaaUser, {"first_name": "first"})
+    """
+    for prop_name in props:
+        if prop_name not in mo_class.prop_meta:
+            return False
+    return True
+
+
+def prop_matcher(mo_class, **kwargs):
+    """
+    Returns a function that checks a managed object against kwargs, the
+    same way mo.check_prop_match(**kwargs) does. The properties are
+    validated and the None values dropped once, which makes the check
+    cheaper when the same kwargs are matched against many objects.
+
+    Args:
+        mo_class (class): managed object class, e.g. AaaUser
+        **kwargs: key-value pair of managed object(MO) property and value
+
+    Returns:
+        function taking a managed object and returning True/False
+
+    Raises:
+        ValueError: if a property is not known to mo_class
+
+    Example:
+        match = prop_matcher(AaaUser, account_status="active")
+        active = [mo for mo in mos if match(mo)]
+    """
+    for prop_name in kwargs:
+        if prop_name not in mo_class.prop_meta:
+            raise ValueError("Unknown Property Name Exception - "
+                             "Class [%s]: Prop <%s> "
+                             % (mo_class.__name__, prop_name))
+
+    expected = [(prop_name, value) for prop_name, value in kwargs.items()
+                if value is not None]
+
+    def match(mo):
+        for prop_name, value in expected:
+            if getattr(mo, prop_name) != value:
+                return False
+        return True
+    return match
+
+
+class _CommitBatch(object):
+    """
+    Stands in for a UcsHandle inside commit_batch. commit() is a no-op,
+    everything else is forwarded to the real handle.
+    """
+
+    def __init__(self, handle):
+        self._batched_handle = handle
+
+    def __getattr__(self, name):
+        return getattr(self._batched_handle, name)
+
+    def commit(self, tag=None, timeout=None):
+        pass
+
+
+@contextmanager
+def commit_batch(handle):
+    """
+    Groups the changes made by several ucsm_apis calls into a single
+    commit. Inside the block, pass the yielded object in place of the
+    handle; the calls stage their managed objects as usual but their own
+    commits are skipped, and one commit is issued when the block exits.
+    If the block raises, the staged changes are discarded.
+
+    Lookups made inside the block see the state on the server, not the
+    objects staged earlier in the same block. For example, creating a
+    provider and adding it to a provider group in one batch fails with
+    "does not exist"; create the parents first.
+
+    The batch uses the handle's commit buffer as it is. Changes already
+    staged on the handle before the block are committed with it, and are
+    discarded with it if the block raises.
+
+    Args:
+        handle (UcsHandle)
+
+    Yields:
+        handle-like object to pass to ucsm_apis calls
+
+    Example:
+        with commit_batch(handle) as batch:
+            radius_provider_group_provider_add(
+              batch, group_name="test_prov_grp", name="test_radius_prov1")
+            radius_provider_group_provider_add(
+              batch, group_name="test_prov_grp", name="test_radius_prov2")
+    """
+    try:
+        yield _CommitBatch(handle)
+    except Exception:
+        handle.commit_buffer_discard()
+        raise
+    handle.commit()